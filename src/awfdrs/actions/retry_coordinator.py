@@ -69,7 +69,7 @@ class RetryCoordinator:
             retry_count=0  # Would need to track actual retry count
         )
 
-        evaluation = await self.rules_engine.evaluate_error(error_code, context)
+        evaluation = self.rules_engine.evaluate_error(error_code, context)
         if not evaluation.should_retry:
             return False
 
@@ -147,6 +147,10 @@ class RetryCoordinator:
         """
         Check if retry is within safety limits.
 
+        The circuit breaker is checked first, then the workflow and vendor
+        retry limits are checked and counted together in one Redis
+        round-trip. A denied retry leaves every retry counter unchanged.
+
         Args:
             workflow_id: Workflow ID
             vendor_id: Vendor ID (optional)
@@ -154,26 +158,8 @@ class RetryCoordinator:
         Returns:
             True if within limits, False otherwise
         """
-        # Check workflow retry limit
-        workflow_ok = await self.safety_limits.check_workflow_retry_limit(workflow_id)
-        if not workflow_ok:
-            logger.warning(
-                f"Workflow retry limit exceeded: {workflow_id}",
-                extra={"workflow_id": str(workflow_id)}
-            )
-            return False
-
-        # Check vendor retry limit if vendor specified
+        # Check circuit breaker before using any retry budget
         if vendor_id:
-            vendor_ok = await self.safety_limits.check_vendor_retry_limit(vendor_id)
-            if not vendor_ok:
-                logger.warning(
-                    f"Vendor retry limit exceeded: {vendor_id}",
-                    extra={"vendor_id": str(vendor_id)}
-                )
-                return False
-
-            # Check circuit breaker
             cb_state = await self.circuit_breaker.check_state(vendor_id)
             if cb_state == CircuitBreakerState.OPEN:
                 logger.warning(
@@ -182,4 +168,22 @@ class RetryCoordinator:
                 )
                 return False
 
+        # Check workflow and vendor retry limits; counted only if both pass
+        workflow_ok, vendor_ok = await self.safety_limits.check_and_increment_retries(
+            workflow_id, vendor_id
+        )
+        if not workflow_ok:
+            logger.warning(
+                f"Workflow retry limit exceeded: {workflow_id}",
+                extra={"workflow_id": str(workflow_id)}
+            )
+            return False
+
+        if not vendor_ok:
+            logger.warning(
+                f"Vendor retry limit exceeded: {vendor_id}",
+                extra={"vendor_id": str(vendor_id)}
+            )
+            return False
+
         return True
@@ -5,7 +5,7 @@ Incident correlation logic.
 import logging
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.awfdrs.db.models.incidents import Incident
@@ -52,7 +52,7 @@ class IncidentCorrelator:
             Related incident if found, None otherwise
         """
         # Calculate time window
-        time_threshold = datetime.utcnow() - timedelta(
+        time_threshold = datetime.now(timezone.utc) - timedelta(
             minutes=self.CORRELATION_WINDOW_MINUTES
         )
 
@@ -95,7 +95,7 @@ class IncidentCorrelator:
             updated_incident = await self.incident_repo.update(
                 incident.id,
                 correlated_event_ids=updated_ids,
-                last_occurrence_at=datetime.utcnow()
+                last_occurrence_at=datetime.now(timezone.utc)
             )
 
             return updated_incident or incident
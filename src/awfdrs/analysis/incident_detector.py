@@ -170,7 +170,7 @@ class IncidentDetector:
 
         # Determine severity from rules engine
         error_code = event.payload.get('error_code', 'unknown')
-        severity = await self.rules_engine.get_error_severity(error_code)
+        severity = self.rules_engine.get_error_severity(error_code)
 
         # Create incident
         incident = await self.incident_repo.create(
@@ -7,6 +7,24 @@ import re
 from typing import Dict, Any
 from src.awfdrs.db.models.events import Event
 
+# Variable data stripped from error messages, applied in order
+_NORMALIZATION_RULES = (
+    # UUIDs
+    (re.compile(
+        r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+        re.IGNORECASE
+    ), 'UUID'),
+    # Timestamps
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}'), 'TIMESTAMP'),
+    # Numeric IDs
+    (re.compile(r'\bid[:\s]*\d+\b', re.IGNORECASE), 'ID'),
+    (re.compile(r'\b\d{6,}\b'), 'NUMERIC_ID'),
+    # IP addresses
+    (re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'), 'IP_ADDRESS'),
+    # Amounts/numbers with decimals
+    (re.compile(r'\$?\d+\.\d+'), 'AMOUNT'),
+)
+
 
 class ErrorSignatureGenerator:
     """
@@ -52,34 +70,9 @@ class ErrorSignatureGenerator:
         if not message:
             return ""
 
-        # Remove UUIDs
-        normalized = re.sub(
-            r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-            'UUID',
-            message,
-            flags=re.IGNORECASE
-        )
-
-        # Remove timestamps
-        normalized = re.sub(
-            r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}',
-            'TIMESTAMP',
-            normalized
-        )
-
-        # Remove numeric IDs
-        normalized = re.sub(r'\bid[:\s]*\d+\b', 'ID', normalized, flags=re.IGNORECASE)
-        normalized = re.sub(r'\b\d{6,}\b', 'NUMERIC_ID', normalized)
-
-        # Remove IP addresses
-        normalized = re.sub(
-            r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
-            'IP_ADDRESS',
-            normalized
-        )
-
-        # Remove amounts/numbers with decimals
-        normalized = re.sub(r'\$?\d+\.\d+', 'AMOUNT', normalized)
+        normalized = message
+        for pattern, replacement in _NORMALIZATION_RULES:
+            normalized = pattern.sub(replacement, normalized)
 
         # Normalize whitespace
         normalized = ' '.join(normalized.split())
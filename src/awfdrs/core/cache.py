@@ -0,0 +1,171 @@
+"""
+Redis-backed cache for ingestion hot-path lookups.
+
+Tenant and workflow status is cached for a short TTL, so a tenant
+deactivation or workflow kill switch takes up to TENANT_STATE_TTL_SECONDS to
+be seen by ingestion.
+"""
+
+import functools
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+import redis.asyncio as redis
+
+from src.awfdrs.config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long tenant/workflow status may be served from the cache
+TENANT_STATE_TTL_SECONDS = 60
+
+_redis_client: Optional[redis.Redis] = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _key(prefix: str, id_: UUID) -> str:
+    """Build the '{prefix}:{id}' cache key; tenant/workflow IDs repeat heavily."""
+    return f"{prefix}:{id_}"
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get the process-wide Redis client, creating it on first use.
+
+    The pool blocks for up to REDIS_POOL_TIMEOUT when every connection is in
+    use, so bursts of concurrent commands queue for a connection instead of
+    failing with "Too many connections".
+
+    Returns:
+        Redis client backed by a shared connection pool
+    """
+    global _redis_client
+    if _redis_client is None:
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.redis.url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=settings.redis.max_connections,
+            timeout=settings.redis.pool_timeout
+        )
+        _redis_client = redis.Redis.from_pool(pool)
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the process-wide Redis client."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+class LookupCache:
+    """
+    Caches tenant and workflow status in Redis.
+
+    All operations fail open: if Redis is unavailable, lookups miss and
+    callers fall back to the database.
+    """
+
+    def __init__(self, redis_client: redis.Redis) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            redis_client: Redis client instance
+        """
+        self.redis_client = redis_client
+
+    async def get_tenant_states(self, tenant_ids: Iterable[UUID]) -> Dict[UUID, bool]:
+        """
+        Get cached is_active flags.
+
+        Args:
+            tenant_ids: Tenant IDs
+
+        Returns:
+            Mapping of tenant ID to is_active for cache hits only
+        """
+        return await self._get_flags("tenant", tenant_ids)
+
+    async def set_tenant_states(self, states: Dict[UUID, bool]) -> None:
+        """
+        Cache is_active flags.
+
+        Args:
+            states: Mapping of tenant ID to is_active
+        """
+        await self._set_flags("tenant", states)
+
+    async def get_workflow_states(self, workflow_ids: Iterable[UUID]) -> Dict[UUID, bool]:
+        """
+        Get cached is_kill_switched flags.
+
+        Args:
+            workflow_ids: Workflow IDs
+
+        Returns:
+            Mapping of workflow ID to is_kill_switched for cache hits only
+        """
+        return await self._get_flags("workflow", workflow_ids)
+
+    async def set_workflow_states(self, states: Dict[UUID, bool]) -> None:
+        """
+        Cache is_kill_switched flags.
+
+        Args:
+            states: Mapping of workflow ID to is_kill_switched
+        """
+        await self._set_flags("workflow", states)
+
+    async def get_event_states(
+        self,
+        tenant_id: UUID,
+        workflow_id: UUID
+    ) -> Tuple[Optional[bool], Optional[bool]]:
+        """
+        Get the cached tenant and workflow flags for one event in a single round-trip.
+
+        Args:
+            tenant_id: Tenant ID
+            workflow_id: Workflow ID
+
+        Returns:
+            (is_active, is_kill_switched), with None for each cache miss
+        """
+        try:
+            tenant_value, workflow_value = await self.redis_client.mget(
+                [_key("tenant", tenant_id), _key("workflow", workflow_id)]
+            )
+        except Exception as e:
+            logger.warning(f"Cache read failed for event status: {str(e)}")
+            return None, None
+        return (
+            None if tenant_value is None else tenant_value == "1",
+            None if workflow_value is None else workflow_value == "1"
+        )
+
+    async def _get_flags(self, prefix: str, ids: Iterable[UUID]) -> Dict[UUID, bool]:
+        """Read boolean flags stored under '{prefix}:{id}'."""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        try:
+            values = await self.redis_client.mget([_key(prefix, id_) for id_ in ids])
+        except Exception as e:
+            logger.warning(f"Cache read failed for {prefix} status: {str(e)}")
+            return {}
+        return {id_: value == "1" for id_, value in zip(ids, values) if value is not None}
+
+    async def _set_flags(self, prefix: str, states: Dict[UUID, bool]) -> None:
+        """Write boolean flags under '{prefix}:{id}' with the status TTL."""
+        if not states:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for id_, flag in states.items():
+                pipe.setex(_key(prefix, id_), TENANT_STATE_TTL_SECONDS, "1" if flag else "0")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache write failed for {prefix} status: {str(e)}")
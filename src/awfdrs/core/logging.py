@@ -6,7 +6,7 @@ Provides correlation ID tracking and structured output.
 import logging
 import sys
 from typing import Any, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
 
@@ -16,7 +16,7 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
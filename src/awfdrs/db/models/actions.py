@@ -2,8 +2,8 @@
 Action model for tracking executed actions.
 """
 
-from sqlalchemy import String, ForeignKey, Boolean, JSON, Text
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import String, ForeignKey, Boolean, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID
 from typing import Optional
@@ -22,7 +22,7 @@ class Action(BaseModel, CorrelationMixin):
         decision_id: Foreign key to decision
         action_type: Type of action taken
         status: Current action status
-        result: Action result (JSON)
+        result: Action result (JSONB)
         error_message: Error message if action failed
         is_reversible: Whether action can be reversed
         reversal_action_id: ID of action that reverses this one (if applicable)
@@ -48,7 +48,7 @@ class Action(BaseModel, CorrelationMixin):
         index=True
     )
     result: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True
     )
     error_message: Mapped[Optional[str]] = mapped_column(
@@ -2,8 +2,8 @@
 Decision model for immutable decision audit trail.
 """
 
-from sqlalchemy import String, ForeignKey, Float, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import String, ForeignKey, Float, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID
 from typing import Optional
@@ -25,7 +25,7 @@ class Decision(BaseModel, CorrelationMixin):
         ai_hypothesis: AI-generated hypothesis (if applicable)
         confidence_score: Confidence in decision (0-1)
         reasoning: Human-readable reasoning
-        metadata: Additional decision metadata (JSON)
+        metadata: Additional decision metadata (JSONB)
         correlation_id: Request correlation ID (from CorrelationMixin)
     """
 
@@ -57,6 +57,12 @@ class Decision(BaseModel, CorrelationMixin):
         nullable=True
     )
     metadata: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True
     )
+
+    # Composite indexes
+    __table_args__ = (
+        # Supports latest-decision lookups without a sort step
+        Index("ix_decisions_incident_created", "incident_id", text("created_at DESC")),
+    )
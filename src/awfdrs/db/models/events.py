@@ -3,8 +3,8 @@ Event model for immutable event storage.
 """
 
 from datetime import datetime
-from sqlalchemy import String, DateTime, JSON, Index
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import String, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID
 
@@ -21,7 +21,7 @@ class Event(BaseModel, TenantMixin, CorrelationMixin):
         tenant_id: Foreign key to tenant (from TenantMixin)
         workflow_id: Foreign key to workflow
         event_type: Type of event (e.g., "payment.failed")
-        payload: Event payload (JSON)
+        payload: Event payload (JSONB)
         idempotency_key: Unique key for deduplication
         occurred_at: When the event actually occurred
         schema_version: Event schema version
@@ -36,7 +36,7 @@ class Event(BaseModel, TenantMixin, CorrelationMixin):
         index=True
     )
     event_type: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
     idempotency_key: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
@@ -52,7 +52,21 @@ class Event(BaseModel, TenantMixin, CorrelationMixin):
 
     # Composite indexes for common queries
     __table_args__ = (
-        Index("ix_events_tenant_workflow", "tenant_id", "workflow_id"),
+        # Trailing (occurred_at, id) columns match the keyset pagination order
+        Index(
+            "ix_events_tenant_workflow",
+            "tenant_id",
+            "workflow_id",
+            text("occurred_at DESC"),
+            text("id DESC"),
+        ),
         Index("ix_events_tenant_occurred", "tenant_id", "occurred_at"),
-        Index("ix_events_tenant_type", "tenant_id", "event_type"),
+        Index(
+            "ix_events_tenant_type",
+            "tenant_id",
+            "event_type",
+            text("occurred_at DESC"),
+            text("id DESC"),
+        ),
+        Index("ix_events_payload", "payload", postgresql_using="gin"),
     )
@@ -2,7 +2,7 @@
 Incident model for failure tracking.
 """
 
-from sqlalchemy import String, ForeignKey, ARRAY, Text, Index
+from sqlalchemy import String, ForeignKey, ARRAY, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID
@@ -68,7 +68,20 @@ class Incident(BaseModel, TenantMixin, CorrelationMixin):
 
     # Composite indexes
     __table_args__ = (
-        Index("ix_incidents_tenant_status", "tenant_id", "status"),
-        Index("ix_incidents_tenant_signature", "tenant_id", "error_signature"),
+        Index(
+            "ix_incidents_tenant_status",
+            "tenant_id",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Partial index covering only DETECTED rows for signature dedup
+        Index(
+            "ix_incidents_active_signature",
+            "tenant_id",
+            "error_signature",
+            text("created_at DESC"),
+            postgresql_where=text(f"status = '{IncidentStatus.DETECTED.value}'"),
+        ),
         Index("ix_incidents_tenant_created", "tenant_id", "created_at"),
     )
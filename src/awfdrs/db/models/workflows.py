@@ -2,8 +2,8 @@
 Workflow model for workflow registry.
 """
 
-from sqlalchemy import String, Boolean, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import String, Boolean, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 
@@ -20,7 +20,7 @@ class Workflow(BaseModel, TenantMixin):
         tenant_id: Foreign key to tenant
         name: Workflow name
         schema_version: Event schema version
-        config: Workflow configuration (JSON)
+        config: Workflow configuration (JSONB)
         is_kill_switched: Whether workflow is kill-switched
     """
 
@@ -28,7 +28,7 @@ class Workflow(BaseModel, TenantMixin):
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     schema_version: Mapped[str] = mapped_column(String(50), default="1.0.0", nullable=False)
-    config: Mapped[dict] = mapped_column(JSON, nullable=True)
+    config: Mapped[dict] = mapped_column(JSONB, nullable=True)
     is_kill_switched: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Note: tenant_id is inherited from TenantMixin
@@ -2,9 +2,9 @@
 Action repository for action execution records.
 """
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from uuid import UUID
-from datetime import datetime
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -50,12 +50,11 @@ class ActionRepository:
             status=ActionStatus.PENDING,
             parameters=parameters or {},
             is_reversible=is_reversible,
-            correlation_id=correlation_id,
-            created_at=datetime.utcnow()
+            correlation_id=correlation_id
         )
 
         self.session.add(action)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(action)
         return action
 
@@ -105,7 +104,6 @@ class ActionRepository:
             .returning(Action)
         )
         result = await self.session.execute(stmt)
-        await self.session.commit()
         return result.scalar_one_or_none()
 
     async def list_by_decision(self, decision_id: UUID) -> List[Action]:
@@ -126,6 +124,35 @@ class ActionRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_decisions(
+        self,
+        decision_ids: List[UUID]
+    ) -> Dict[UUID, List[Action]]:
+        """
+        List actions for several decisions in a single query.
+
+        Args:
+            decision_ids: Decision IDs
+
+        Returns:
+            Mapping of decision ID to its actions ordered by creation time
+            (decisions without actions are omitted)
+        """
+        if not decision_ids:
+            return {}
+
+        stmt = (
+            select(Action)
+            .where(Action.decision_id.in_(decision_ids))
+            .order_by(Action.created_at.desc())
+        )
+        result = await self.session.execute(stmt)
+
+        actions_by_decision: Dict[UUID, List[Action]] = defaultdict(list)
+        for action in result.scalars().all():
+            actions_by_decision[action.decision_id].append(action)
+        return dict(actions_by_decision)
+
     async def list_by_incident(self, incident_id: UUID) -> List[Action]:
         """
         List all actions for an incident (via decisions).
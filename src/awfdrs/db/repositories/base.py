@@ -2,6 +2,7 @@
 Base repository with generic CRUD operations.
 """
 
+import functools
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 from uuid import UUID
 from sqlalchemy import select
@@ -12,6 +13,12 @@ from src.awfdrs.db.base import BaseModel
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def _column_map(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Map column keys to columns, built once per model class."""
+    return {column.key: column for column in model.__table__.columns}
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Base repository providing generic CRUD operations.
@@ -29,6 +36,7 @@ class BaseRepository(Generic[ModelType]):
         """
         self.model = model
         self.session = session
+        self._columns = _column_map(model)
 
     async def get(self, id: UUID) -> Optional[ModelType]:
         """
@@ -61,13 +69,21 @@ class BaseRepository(Generic[ModelType]):
 
         Returns:
             List of model instances
+
+        Raises:
+            ValueError: If a filter names a column the model does not have
         """
         query = select(self.model)
 
         if filters:
-            for column, value in filters.items():
-                if hasattr(self.model, column):
-                    query = query.where(getattr(self.model, column) == value)
+            unknown = filters.keys() - self._columns.keys()
+            if unknown:
+                raise ValueError(
+                    f"Unknown filter columns for {self.model.__name__}: {sorted(unknown)}"
+                )
+            query = query.where(
+                *(self._columns[column] == value for column, value in filters.items())
+            )
 
         query = query.offset(skip).limit(limit)
 
@@ -86,7 +102,7 @@ class BaseRepository(Generic[ModelType]):
         """
         instance = self.model(**kwargs)
         self.session.add(instance)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(instance)
         return instance
 
@@ -109,7 +125,7 @@ class BaseRepository(Generic[ModelType]):
             if hasattr(instance, key):
                 setattr(instance, key, value)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(instance)
         return instance
 
@@ -128,5 +144,5 @@ class BaseRepository(Generic[ModelType]):
             return False
 
         await self.session.delete(instance)
-        await self.session.commit()
+        await self.session.flush()
         return True
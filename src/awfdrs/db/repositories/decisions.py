@@ -2,9 +2,8 @@
 Decision repository for immutable decision records.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
-from datetime import datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -58,12 +57,11 @@ class DecisionRepository:
             confidence_score=confidence_score,
             reasoning=reasoning,
             metadata=metadata or {},
-            correlation_id=correlation_id,
-            created_at=datetime.utcnow()
+            correlation_id=correlation_id
         )
 
         self.session.add(decision)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(decision)
         return decision
 
@@ -117,3 +115,31 @@ class DecisionRepository:
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_latest_by_incidents(
+        self,
+        incident_ids: List[UUID]
+    ) -> Dict[UUID, Decision]:
+        """
+        Get the most recent decision for each of several incidents.
+
+        Uses a single DISTINCT ON query instead of one lookup per incident.
+
+        Args:
+            incident_ids: Incident IDs
+
+        Returns:
+            Mapping of incident ID to its latest decision (incidents without
+            decisions are omitted)
+        """
+        if not incident_ids:
+            return {}
+
+        stmt = (
+            select(Decision)
+            .distinct(Decision.incident_id)
+            .where(Decision.incident_id.in_(incident_ids))
+            .order_by(Decision.incident_id, Decision.created_at.desc())
+        )
+        result = await self.session.execute(stmt)
+        return {decision.incident_id: decision for decision in result.scalars().all()}
@@ -2,10 +2,12 @@
 Event repository for immutable event storage.
 """
 
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, List, Set, Tuple, Union
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import select
+import orjson
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.awfdrs.db.models.events import Event
@@ -19,6 +21,25 @@ class EventRepository:
     Events are immutable - no update or delete operations are provided.
     """
 
+    # Rows fetched per round-trip when streaming large result sets
+    STREAM_CHUNK_SIZE = 200
+
+    # Columns written by create_events; the remaining columns use server defaults
+    COPY_COLUMNS = [
+        "id",
+        "tenant_id",
+        "workflow_id",
+        "event_type",
+        "payload",
+        "idempotency_key",
+        "occurred_at",
+        "schema_version",
+        "correlation_id",
+    ]
+
+    # Session-local table that create_events copies rows into before inserting
+    STAGING_TABLE = "events_staging"
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository."""
         self.session = session
@@ -32,7 +53,8 @@ class EventRepository:
         idempotency_key: str,
         occurred_at: datetime,
         schema_version: str = "1.0.0",
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        serialized_payload: Optional[bytes] = None
     ) -> Event:
         """
         Create a new event.
@@ -46,6 +68,7 @@ class EventRepository:
             occurred_at: When event occurred
             schema_version: Event schema version
             correlation_id: Request correlation ID
+            serialized_payload: Payload already encoded as JSON, stored as-is
 
         Returns:
             Created event
@@ -53,29 +76,116 @@ class EventRepository:
         Raises:
             ConflictError: If idempotency key already exists
         """
-        # Check for duplicate idempotency key
-        existing = await self.get_by_idempotency_key(idempotency_key)
-        if existing:
+        # The unique index on idempotency_key detects duplicates atomically,
+        # so there is no SELECT-before-INSERT race
+        stmt = (
+            pg_insert(Event)
+            .values(
+                tenant_id=tenant_id,
+                workflow_id=workflow_id,
+                event_type=event_type,
+                payload=orjson.Fragment(serialized_payload) if serialized_payload is not None else payload,
+                idempotency_key=idempotency_key,
+                occurred_at=occurred_at,
+                schema_version=schema_version,
+                correlation_id=correlation_id
+            )
+            .on_conflict_do_nothing(index_elements=[Event.idempotency_key])
+            .returning(Event)
+        )
+        event = await self.session.scalar(stmt)
+
+        if event is None:
+            existing = await self.get_by_idempotency_key(idempotency_key)
             raise ConflictError(
                 f"Event with idempotency_key '{idempotency_key}' already exists",
-                details={"event_id": str(existing.id)}
+                details={"event_id": str(existing.id) if existing else None}
             )
 
-        event = Event(
-            tenant_id=tenant_id,
-            workflow_id=workflow_id,
-            event_type=event_type,
-            payload=payload,
-            idempotency_key=idempotency_key,
-            occurred_at=occurred_at,
-            schema_version=schema_version,
-            correlation_id=correlation_id
+        return event
+
+    async def create_events(self, rows: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Bulk insert events with COPY, skipping idempotency keys that already exist.
+
+        COPY streams all rows in one command, avoiding per-row statement
+        parsing, but cannot skip conflicting rows. The rows are therefore
+        copied into a temporary staging table and moved into events with
+        one INSERT ... SELECT ... ON CONFLICT DO NOTHING, so a key stored
+        concurrently after the caller's preflight check (see
+        get_existing_idempotency_keys) drops only that row. Everything runs
+        on the session's connection, inside the session's transaction.
+        Callers supply each row's id.
+
+        Args:
+            rows: Column values for each event, keyed by COPY_COLUMNS; the
+                payload may be a dict or already-encoded JSON bytes
+
+        Returns:
+            Idempotency keys of the rows that were inserted
+        """
+        if not rows:
+            return set()
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        columns = ", ".join(self.COPY_COLUMNS)
+
+        # Also opens the driver transaction that COPY has to run inside
+        await connection.exec_driver_sql(
+            f"CREATE TEMP TABLE {self.STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {Event.__tablename__} WITH NO DATA"
         )
 
-        self.session.add(event)
-        await self.session.commit()
-        await self.session.refresh(event)
-        return event
+        # The JSONB codec registered by SQLAlchemy expects serialized text
+        records = [
+            tuple(
+                self._encode_payload(row[column]) if column == "payload" else row[column]
+                for column in self.COPY_COLUMNS
+            )
+            for row in rows
+        ]
+        await driver_connection.copy_records_to_table(
+            self.STAGING_TABLE,
+            columns=self.COPY_COLUMNS,
+            records=records
+        )
+
+        result = await connection.exec_driver_sql(
+            f"INSERT INTO {Event.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM {self.STAGING_TABLE} "
+            "ON CONFLICT (idempotency_key) DO NOTHING "
+            "RETURNING idempotency_key"
+        )
+        inserted_keys = set(result.scalars().all())
+
+        # Dropped now rather than at commit, so the same transaction can
+        # bulk insert again
+        await connection.exec_driver_sql(f"DROP TABLE {self.STAGING_TABLE}")
+        return inserted_keys
+
+    @staticmethod
+    def _encode_payload(payload: Union[dict, bytes]) -> str:
+        """Return a payload as JSON text, reusing pre-encoded bytes."""
+        if isinstance(payload, bytes):
+            return payload.decode()
+        return orjson.dumps(payload).decode()
+
+    async def get_existing_idempotency_keys(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given idempotency keys are already stored.
+
+        Args:
+            keys: Idempotency keys to check
+
+        Returns:
+            Subset of keys that already exist
+        """
+        result = await self.session.execute(
+            select(Event.idempotency_key).where(Event.idempotency_key.in_(set(keys)))
+        )
+        return set(result.scalars().all())
 
     async def get_by_idempotency_key(self, idempotency_key: str) -> Optional[Event]:
         """
@@ -96,28 +206,31 @@ class EventRepository:
         self,
         tenant_id: UUID,
         workflow_id: UUID,
-        skip: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
         limit: int = 100
     ) -> List[Event]:
         """
-        List events for a workflow.
+        List events for a workflow using keyset pagination.
 
         Args:
             tenant_id: Tenant ID
             workflow_id: Workflow ID
-            skip: Number to skip
+            after: (occurred_at, id) of the last event on the previous page
             limit: Maximum to return
 
         Returns:
-            List of events
+            List of events ordered by (occurred_at, id) descending
         """
-        result = await self.session.execute(
+        stmt = (
             select(Event)
             .where(Event.tenant_id == tenant_id)
             .where(Event.workflow_id == workflow_id)
-            .order_by(Event.occurred_at.desc())
-            .offset(skip)
-            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Event.occurred_at, Event.id) < tuple_(*after))
+
+        result = await self.session.execute(
+            stmt.order_by(Event.occurred_at.desc(), Event.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
 
@@ -125,27 +238,85 @@ class EventRepository:
         self,
         tenant_id: UUID,
         event_type: str,
-        skip: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
         limit: int = 100
     ) -> List[Event]:
         """
-        List events by type.
+        List events by type using keyset pagination.
 
         Args:
             tenant_id: Tenant ID
             event_type: Event type
-            skip: Number to skip
+            after: (occurred_at, id) of the last event on the previous page
             limit: Maximum to return
 
         Returns:
-            List of events
+            List of events ordered by (occurred_at, id) descending
         """
+        stmt = (
+            select(Event)
+            .where(Event.tenant_id == tenant_id)
+            .where(Event.event_type == event_type)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Event.occurred_at, Event.id) < tuple_(*after))
+
         result = await self.session.execute(
+            stmt.order_by(Event.occurred_at.desc(), Event.id.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def iter_by_workflow(
+        self,
+        tenant_id: UUID,
+        workflow_id: UUID
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events for a workflow without buffering the full result.
+
+        Rows are fetched from a server-side cursor in chunks of
+        STREAM_CHUNK_SIZE, so memory stays bounded for large workflows.
+
+        Args:
+            tenant_id: Tenant ID
+            workflow_id: Workflow ID
+
+        Yields:
+            Events ordered by occurrence time (newest first)
+        """
+        stmt = (
+            select(Event)
+            .where(Event.tenant_id == tenant_id)
+            .where(Event.workflow_id == workflow_id)
+            .order_by(Event.occurred_at.desc())
+            .execution_options(yield_per=self.STREAM_CHUNK_SIZE)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for event in result:
+            yield event
+
+    async def iter_by_type(
+        self,
+        tenant_id: UUID,
+        event_type: str
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events of a given type without buffering the full result.
+
+        Args:
+            tenant_id: Tenant ID
+            event_type: Event type
+
+        Yields:
+            Events ordered by occurrence time (newest first)
+        """
+        stmt = (
             select(Event)
             .where(Event.tenant_id == tenant_id)
             .where(Event.event_type == event_type)
             .order_by(Event.occurred_at.desc())
-            .offset(skip)
-            .limit(limit)
+            .execution_options(yield_per=self.STREAM_CHUNK_SIZE)
         )
-        return list(result.scalars().all())
+        result = await self.session.stream_scalars(stmt)
+        async for event in result:
+            yield event
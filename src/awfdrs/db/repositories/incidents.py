@@ -2,15 +2,19 @@
 Incident repository for incident management.
 """
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import literal_column, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.awfdrs.db.models.incidents import Incident
 from src.awfdrs.db.repositories.base import BaseRepository
 from src.awfdrs.core.enums import IncidentStatus
 
+# Matches the WHERE clause of the ix_incidents_active_signature partial index
+_DETECTED_LITERAL = literal_column(f"'{IncidentStatus.DETECTED.value}'")
+
 
 class IncidentRepository(BaseRepository[Incident]):
     """Repository for incident operations."""
@@ -38,7 +42,9 @@ class IncidentRepository(BaseRepository[Incident]):
             select(Incident)
             .where(Incident.tenant_id == tenant_id)
             .where(Incident.error_signature == error_signature)
-            .where(Incident.status == IncidentStatus.DETECTED)
+            # Inlined rather than bound, so even a generic plan for the cached
+            # prepared statement matches ix_incidents_active_signature's predicate
+            .where(Incident.status == _DETECTED_LITERAL)
             .order_by(Incident.created_at.desc())
             .limit(1)
         )
@@ -71,27 +77,30 @@ class IncidentRepository(BaseRepository[Incident]):
         self,
         tenant_id: UUID,
         status: IncidentStatus,
-        skip: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
         limit: int = 100
     ) -> List[Incident]:
         """
-        List incidents by status.
+        List incidents by status using keyset pagination.
 
         Args:
             tenant_id: Tenant ID
             status: Incident status
-            skip: Number to skip
+            after: (created_at, id) of the last incident on the previous page
             limit: Maximum to return
 
         Returns:
-            List of incidents
+            List of incidents ordered by (created_at, id) descending
         """
-        result = await self.session.execute(
+        stmt = (
             select(Incident)
             .where(Incident.tenant_id == tenant_id)
             .where(Incident.status == status)
-            .order_by(Incident.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Incident.created_at, Incident.id) < tuple_(*after))
+
+        result = await self.session.execute(
+            stmt.order_by(Incident.created_at.desc(), Incident.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
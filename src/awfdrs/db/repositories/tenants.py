@@ -2,7 +2,7 @@
 Tenant repository for tenant management.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -43,5 +43,22 @@ class TenantRepository(BaseRepository[Tenant]):
         Returns:
             True if active, False otherwise
         """
-        tenant = await self.get(tenant_id)
-        return tenant is not None and tenant.is_active
+        result = await self.session.execute(
+            select(Tenant.is_active).where(Tenant.id == tenant_id)
+        )
+        return bool(result.scalar_one_or_none())
+
+    async def get_active_states(self, tenant_ids: Iterable[UUID]) -> Dict[UUID, bool]:
+        """
+        Get the active flag for several tenants in one query.
+
+        Args:
+            tenant_ids: Tenant IDs
+
+        Returns:
+            Mapping of tenant ID to is_active; unknown tenants are absent
+        """
+        result = await self.session.execute(
+            select(Tenant.id, Tenant.is_active).where(Tenant.id.in_(set(tenant_ids)))
+        )
+        return {tenant_id: is_active for tenant_id, is_active in result.all()}
@@ -2,9 +2,10 @@
 Vendor repository for vendor-specific operations.
 """
 
-from typing import Optional
+from datetime import timedelta
+from typing import Any, Dict, Optional
 from uuid import UUID
-from sqlalchemy import select, update
+from sqlalchemy import and_, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.awfdrs.db.models.vendors import Vendor
@@ -17,7 +18,7 @@ class VendorRepository(BaseRepository[Vendor]):
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository."""
-        super().__init__(session, Vendor)
+        super().__init__(Vendor, session)
 
     async def get_by_name(self, name: str) -> Optional[Vendor]:
         """
@@ -55,7 +56,6 @@ class VendorRepository(BaseRepository[Vendor]):
             .returning(Vendor)
         )
         result = await self.session.execute(stmt)
-        await self.session.commit()
         return result.scalar_one_or_none()
 
     async def increment_failure_count(self, vendor_id: UUID) -> Optional[Vendor]:
@@ -71,7 +71,7 @@ class VendorRepository(BaseRepository[Vendor]):
         vendor = await self.get(vendor_id)
         if vendor:
             vendor.failure_count += 1
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(vendor)
         return vendor
 
@@ -92,5 +92,137 @@ class VendorRepository(BaseRepository[Vendor]):
             .returning(Vendor)
         )
         result = await self.session.execute(stmt)
-        await self.session.commit()
         return result.scalar_one_or_none()
+
+    async def record_success(self, vendor_id: UUID) -> Optional[Vendor]:
+        """
+        Record a successful call in a single UPDATE.
+
+        Stamps last_success_at and, unless the circuit is OPEN, resets the
+        failure count and closes the circuit.
+
+        Args:
+            vendor_id: Vendor ID
+
+        Returns:
+            Updated vendor if found, None otherwise
+        """
+        is_open = Vendor.circuit_breaker_state == CircuitBreakerState.OPEN
+        stmt = (
+            update(Vendor)
+            .where(Vendor.id == vendor_id)
+            .values(
+                failure_count=case((is_open, Vendor.failure_count), else_=0),
+                circuit_breaker_state=case(
+                    (is_open, Vendor.circuit_breaker_state),
+                    else_=CircuitBreakerState.CLOSED.value
+                ),
+                last_success_at=func.now()
+            )
+            .returning(Vendor)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def record_failure(
+        self,
+        vendor_id: UUID,
+        failure_threshold: int,
+        open_circuit: bool = False,
+        threshold_overrides: Optional[Dict[str, int]] = None
+    ) -> Optional[Vendor]:
+        """
+        Record a failed call in a single UPDATE.
+
+        Increments the failure count, stamps last_failure_at and opens a
+        CLOSED circuit once the threshold is reached.
+
+        Args:
+            vendor_id: Vendor ID
+            failure_threshold: Failure count at which a CLOSED circuit opens
+            open_circuit: Open the circuit regardless of its current state
+            threshold_overrides: Per-vendor thresholds keyed by vendor name,
+                resolved in SQL so the vendor need not be loaded first
+
+        Returns:
+            Updated vendor if found, None otherwise
+        """
+        failure_threshold = self._by_vendor_name(failure_threshold, threshold_overrides)
+
+        if open_circuit:
+            new_state = CircuitBreakerState.OPEN.value
+        else:
+            new_state = case(
+                (
+                    and_(
+                        Vendor.circuit_breaker_state == CircuitBreakerState.CLOSED,
+                        Vendor.failure_count + 1 >= failure_threshold
+                    ),
+                    CircuitBreakerState.OPEN.value
+                ),
+                else_=Vendor.circuit_breaker_state
+            )
+
+        stmt = (
+            update(Vendor)
+            .where(Vendor.id == vendor_id)
+            .values(
+                failure_count=Vendor.failure_count + 1,
+                circuit_breaker_state=new_state,
+                last_failure_at=func.now()
+            )
+            .returning(Vendor)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def check_open_timeout(
+        self,
+        vendor_id: UUID,
+        timeout_seconds: int,
+        timeout_overrides: Optional[Dict[str, int]] = None
+    ) -> Optional[str]:
+        """
+        Get the circuit state, moving OPEN to HALF_OPEN once the timeout has elapsed.
+
+        A single statement: a CTE performs the conditional UPDATE (which
+        only writes when the transition happens) and the outer SELECT falls
+        back to the current state when it does not.
+
+        Args:
+            vendor_id: Vendor ID
+            timeout_seconds: Seconds after the last failure before an OPEN circuit is retried
+            timeout_overrides: Per-vendor timeouts keyed by vendor name
+
+        Returns:
+            Circuit breaker state after the check, or None if vendor not found
+        """
+        timeout = self._by_vendor_name(
+            timedelta(seconds=timeout_seconds),
+            {name: timedelta(seconds=secs) for name, secs in (timeout_overrides or {}).items()}
+        )
+        transitioned = (
+            update(Vendor)
+            .where(Vendor.id == vendor_id)
+            .where(Vendor.circuit_breaker_state == CircuitBreakerState.OPEN)
+            .where(Vendor.last_failure_at <= func.now() - timeout)
+            .values(circuit_breaker_state=CircuitBreakerState.HALF_OPEN.value)
+            .returning(Vendor.circuit_breaker_state)
+            .cte("transitioned")
+        )
+        stmt = select(
+            func.coalesce(
+                select(transitioned.c.circuit_breaker_state).scalar_subquery(),
+                select(Vendor.circuit_breaker_state)
+                .where(Vendor.id == vendor_id)
+                .scalar_subquery()
+            )
+        )
+        return await self.session.scalar(stmt)
+
+    @staticmethod
+    def _by_vendor_name(default: Any, overrides: Optional[Dict[str, Any]]) -> Any:
+        """Build a SQL value that picks a per-vendor override by name, else the default."""
+        if not overrides:
+            return default
+        return case(overrides, value=Vendor.name, else_=default)
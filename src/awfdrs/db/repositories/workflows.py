@@ -2,7 +2,7 @@
 Workflow repository for workflow management.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,3 +52,22 @@ class WorkflowRepository(BaseRepository[Workflow]):
         """
         workflow = await self.get(workflow_id)
         return workflow is not None and workflow.is_kill_switched
+
+    async def get_kill_switch_states(
+        self,
+        workflow_ids: Iterable[UUID]
+    ) -> Dict[UUID, bool]:
+        """
+        Get the kill-switch flag for several workflows in one query.
+
+        Args:
+            workflow_ids: Workflow IDs
+
+        Returns:
+            Mapping of workflow ID to is_kill_switched; unknown workflows are absent
+        """
+        result = await self.session.execute(
+            select(Workflow.id, Workflow.is_kill_switched)
+            .where(Workflow.id.in_(set(workflow_ids)))
+        )
+        return {workflow_id: killed for workflow_id, killed in result.all()}
@@ -2,7 +2,8 @@
 Database session management with async support.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -12,14 +13,33 @@ from sqlalchemy.pool import NullPool
 from src.awfdrs.config import settings
 
 
-# Create async engine
+def _json_serializer(value: Any) -> str:
+    """
+    Serialize JSON column values with orjson.
+
+    The asyncpg dialect already binds JSONB in binary format, so this is the
+    only encode on the write path. Payloads that were serialized during
+    validation arrive as orjson.Fragment and are passed through unchanged.
+    """
+    return orjson.dumps(value).decode()
+
+
+# Create async engine.
+# LIFO checkout keeps reusing the most recently returned connections, so
+# during low traffic the rest sit idle and age out via pool_recycle. Pre-ping
+# costs a round-trip per checkout and is left to environments with flaky
+# networks (DATABASE_POOL_PRE_PING).
 engine = create_async_engine(
     settings.database.url,
     echo=settings.database.echo,
     pool_size=settings.database.pool_size,
-    max_overflow=10,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    max_overflow=settings.database.max_overflow,
+    pool_timeout=settings.database.pool_timeout,
+    pool_use_lifo=True,
+    pool_pre_ping=settings.database.pool_pre_ping,
+    pool_recycle=settings.database.pool_recycle,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -36,12 +56,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
 
+    The request is the unit of work: repositories only flush, and the
+    session is committed once after the handler returns (or rolled back
+    if it raised). Routes depend on it with scope="function" (see
+    get_db_session) so the commit happens before the response is sent.
+
     Yields:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
         finally:
             await session.close()
 
@@ -2,10 +2,10 @@
 FastAPI dependencies.
 """
 
-from typing import AsyncGenerator
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.awfdrs.core.cache import LookupCache, get_redis_client
 from src.awfdrs.db.session import get_db
 
 
@@ -19,19 +19,36 @@ async def get_correlation_id(request: Request) -> str:
     Returns:
         Correlation ID
     """
-    return getattr(request.state, "correlation_id", "unknown")
+    return request.scope.get("state", {}).get("correlation_id", "unknown")
 
 
 async def get_db_session(
-    session: AsyncSession = Depends(get_db)
-) -> AsyncGenerator[AsyncSession, None]:
+    session: AsyncSession = Depends(get_db, scope="function")
+) -> AsyncSession:
     """
     Get database session dependency.
 
+    get_db is function-scoped so its commit runs when the handler returns,
+    before the response is sent; a failed commit becomes an error response
+    instead of following a success status the client has already received.
+
     Args:
         session: Database session
 
-    Yields:
+    Returns:
         Database session
     """
-    yield session
+    return session
+
+
+async def get_lookup_cache() -> LookupCache:
+    """
+    Get the ingestion lookup cache dependency.
+
+    Override this dependency to inject a fake cache, or to return None and
+    have ingestion query the database directly.
+
+    Returns:
+        Lookup cache backed by the shared Redis client
+    """
+    return LookupCache(get_redis_client())
@@ -2,15 +2,33 @@
 Event ingestion API endpoints.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.awfdrs.ingestion.schemas import WorkflowEventV1, EventResponse
+from src.awfdrs.ingestion.schemas import (
+    WorkflowEventV1,
+    WorkflowEventListAdapter,
+    EventResponse,
+    BatchEventResponse
+)
 from src.awfdrs.ingestion.service import IngestionService
-from src.awfdrs.dependencies import get_db_session, get_correlation_id
+from src.awfdrs.dependencies import get_db_session, get_correlation_id, get_lookup_cache
+from src.awfdrs.core.cache import LookupCache
+from src.awfdrs.core.exceptions import ValidationError
 
 router = APIRouter()
 
+# Largest batch accepted by POST /events/batch
+MAX_BATCH_SIZE = 100
+
+# Responses are serialized once with pydantic-core and returned directly, so
+# FastAPI skips re-validating the model against response_model. The
+# response_model declarations still document the schema in OpenAPI.
+JSON_MEDIA_TYPE = "application/json"
+
 
 @router.post(
     "/events",
@@ -22,8 +40,9 @@ router = APIRouter()
 async def submit_event(
     event: WorkflowEventV1,
     session: AsyncSession = Depends(get_db_session),
-    correlation_id: str = Depends(get_correlation_id)
-) -> EventResponse:
+    correlation_id: str = Depends(get_correlation_id),
+    cache: Optional[LookupCache] = Depends(get_lookup_cache)
+) -> Response:
     """
     Submit a workflow event.
 
@@ -31,9 +50,10 @@ async def submit_event(
         event: Event to submit
         session: Database session
         correlation_id: Request correlation ID
+        cache: Tenant/workflow lookup cache
 
     Returns:
-        EventResponse with event ID
+        JSON-encoded EventResponse with event ID
 
     Raises:
         400: Invalid request
@@ -42,5 +62,78 @@ async def submit_event(
         409: Duplicate idempotency key
         422: Validation error
     """
-    service = IngestionService(session, correlation_id)
-    return await service.ingest_event(event)
+    service = IngestionService(session, correlation_id, cache)
+    response = await service.ingest_event(event)
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type=JSON_MEDIA_TYPE
+    )
+
+
+@router.post(
+    "/events/batch",
+    response_model=BatchEventResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Submit workflow events in bulk",
+    description="Submit up to 100 workflow events in a single request",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/WorkflowEventV1"}
+                    }
+                }
+            }
+        }
+    }
+)
+async def submit_events_batch(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+    correlation_id: str = Depends(get_correlation_id),
+    cache: Optional[LookupCache] = Depends(get_lookup_cache)
+) -> Response:
+    """
+    Submit a batch of workflow events.
+
+    Events are accepted or rejected individually; the response lists the
+    stored event IDs and the reason each rejected event failed. The body is
+    parsed with WorkflowEventListAdapter in a single pass rather than by
+    FastAPI's per-item body validation.
+
+    Args:
+        request: Request whose body is a JSON array of events
+        session: Database session
+        correlation_id: Request correlation ID
+        cache: Tenant/workflow lookup cache
+
+    Returns:
+        JSON-encoded BatchEventResponse with processed/failed counts
+
+    Raises:
+        422: Empty batch, batch larger than MAX_BATCH_SIZE, or malformed event
+    """
+    try:
+        events = WorkflowEventListAdapter.validate_json(await request.body())
+    except PydanticValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+    if not events or len(events) > MAX_BATCH_SIZE:
+        raise ValidationError(
+            f"Batch must contain between 1 and {MAX_BATCH_SIZE} events",
+            details={"size": len(events), "max_size": MAX_BATCH_SIZE}
+        )
+
+    service = IngestionService(session, correlation_id, cache)
+    response = await service.ingest_events_batch(events)
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_200_OK,
+        media_type=JSON_MEDIA_TYPE
+    )
@@ -2,6 +2,9 @@
 Health check API endpoints.
 """
 
+import asyncio
+import time
+from typing import Optional
 from fastapi import APIRouter, Depends, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +14,13 @@ from src.awfdrs.dependencies import get_db_session
 
 router = APIRouter()
 
+# How long a database probe result is reused across readiness polls
+READINESS_CACHE_SECONDS = 1.0
+
+_readiness_lock = asyncio.Lock()
+_cached_database_status: Optional[str] = None
+_cached_at = 0.0
+
 
 @router.get(
     "/health",
@@ -42,7 +52,9 @@ async def readiness_check(
     """
     Readiness check with database connectivity.
 
-    Verifies that the service can connect to the database.
+    Verifies that the service can connect to the database. The probe result
+    is shared by all callers for READINESS_CACHE_SECONDS, so frequent polls
+    from load balancers do not each take a pooled connection.
 
     Args:
         session: Database session
@@ -53,13 +65,7 @@ async def readiness_check(
     Raises:
         500: If database is not accessible
     """
-    # Check database connectivity
-    try:
-        result = await session.execute(text("SELECT 1"))
-        result.scalar_one()
-        database_status = "ok"
-    except Exception as e:
-        database_status = f"error: {str(e)}"
+    database_status = await _check_database(session)
 
     # Note: Redis check would go here when we implement caching
     redis_status = "ok"
@@ -69,3 +75,35 @@ async def readiness_check(
         database=database_status,
         redis=redis_status
     )
+
+
+async def _check_database(session: AsyncSession) -> str:
+    """
+    Run the database probe, reusing a result younger than READINESS_CACHE_SECONDS.
+
+    Args:
+        session: Database session, only used when the cached result is stale
+
+    Returns:
+        "ok", or an error description
+    """
+    global _cached_database_status, _cached_at
+
+    if _cached_database_status is not None and time.monotonic() - _cached_at < READINESS_CACHE_SECONDS:
+        return _cached_database_status
+
+    async with _readiness_lock:
+        # Another caller may have refreshed the result while we waited
+        if _cached_database_status is not None and time.monotonic() - _cached_at < READINESS_CACHE_SECONDS:
+            return _cached_database_status
+
+        try:
+            result = await session.execute(text("SELECT 1"))
+            result.scalar_one()
+            database_status = "ok"
+        except Exception as e:
+            database_status = f"error: {str(e)}"
+
+        _cached_database_status = database_status
+        _cached_at = time.monotonic()
+        return database_status
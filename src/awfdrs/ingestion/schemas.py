@@ -2,13 +2,56 @@
 Ingestion API schemas.
 """
 
-from datetime import datetime
-from typing import Dict, Any
+import re
+from datetime import datetime, timezone
+from typing import Dict, Any, FrozenSet, List, Optional
 from uuid import UUID
-from pydantic import Field, field_validator
+import orjson
+from pydantic import ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
 
 from src.awfdrs.core.schemas import BaseSchema
 
+# Event schema versions accepted by ingestion
+SUPPORTED_SCHEMA_VERSIONS: FrozenSet[str] = frozenset({"1.0.0"})
+
+# ASCII letters, digits, dot, hyphen and underscore; at least 3 characters
+_EVENT_TYPE_RE = re.compile(r"[A-Za-z0-9._-]{3,}")
+
+# Maximum encoded payload size
+MAX_PAYLOAD_BYTES = 1024 * 1024  # 1MB
+
+# Flat payloads within these bounds skip serialization when the size is checked
+SMALL_PAYLOAD_MAX_KEYS = 50
+SMALL_PAYLOAD_MAX_CHARS = 8192
+
+
+def _is_small_payload(payload: Dict[str, Any]) -> bool:
+    """
+    Cheaply decide whether a payload is certainly under MAX_PAYLOAD_BYTES.
+
+    Only flat payloads qualify: nested containers could hide arbitrary
+    amounts of data. With fewer than SMALL_PAYLOAD_MAX_KEYS entries and under
+    SMALL_PAYLOAD_MAX_CHARS characters, even worst-case JSON escaping (six
+    bytes per character) stays far below 1MB. Integers outside the 64-bit
+    range that orjson can encode also disqualify the fast path.
+    """
+    if len(payload) >= SMALL_PAYLOAD_MAX_KEYS:
+        return False
+
+    rough = 0
+    for key, value in payload.items():
+        rough += len(key)
+        if isinstance(value, str):
+            rough += len(value)
+        elif value is None or isinstance(value, (bool, float)):
+            rough += 16
+        elif isinstance(value, int) and -2**63 <= value < 2**64:
+            rough += 16
+        else:
+            return False
+
+    return rough < SMALL_PAYLOAD_MAX_CHARS
+
 
 class WorkflowEventV1(BaseSchema):
     """
@@ -25,21 +68,32 @@ class WorkflowEventV1(BaseSchema):
     occurred_at: datetime = Field(..., description="When the event occurred")
     schema_version: str = Field(default="1.0.0", description="Event schema version")
 
+    # Payload encoded while checking its size, reused when storing the event
+    _payload_json: Optional[bytes] = PrivateAttr(default=None)
+
     @field_validator('event_type')
     @classmethod
     def validate_event_type(cls, v: str) -> str:
         """Validate event type format."""
-        if not v or len(v) < 3:
-            raise ValueError("Event type must be at least 3 characters")
-        if not all(c.isalnum() or c in "._-" for c in v):
+        if not _EVENT_TYPE_RE.fullmatch(v):
+            if len(v) < 3:
+                raise ValueError("Event type must be at least 3 characters")
             raise ValueError("Event type can only contain alphanumeric, dot, hyphen, and underscore")
         return v
 
+    @field_validator('payload')
+    @classmethod
+    def validate_payload(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate payload is not empty."""
+        if not v:
+            raise ValueError("Payload cannot be empty")
+        return v
+
     @field_validator('idempotency_key')
     @classmethod
     def validate_idempotency_key(cls, v: str) -> str:
         """Validate idempotency key."""
-        if not v or len(v) < 1:
+        if not v:
             raise ValueError("Idempotency key cannot be empty")
         if len(v) > 255:
             raise ValueError("Idempotency key cannot exceed 255 characters")
@@ -49,26 +103,72 @@ class WorkflowEventV1(BaseSchema):
     @classmethod
     def validate_schema_version(cls, v: str) -> str:
         """Validate schema version."""
-        supported_versions = ["1.0.0"]
-        if v not in supported_versions:
-            raise ValueError(f"Schema version must be one of: {supported_versions}")
+        if v not in SUPPORTED_SCHEMA_VERSIONS:
+            raise ValueError(f"Schema version must be one of: {sorted(SUPPORTED_SCHEMA_VERSIONS)}")
         return v
 
+    @model_validator(mode='after')
+    def validate_payload_size(self) -> "WorkflowEventV1":
+        """Validate encoded payload size, keeping the encoding for storage."""
+        if _is_small_payload(self.payload):
+            return self
+
+        try:
+            payload_json = orjson.dumps(self.payload)
+        except orjson.JSONEncodeError as e:
+            raise ValueError(f"Payload cannot be serialized as JSON: {e}")
+
+        if len(payload_json) > MAX_PAYLOAD_BYTES:
+            raise ValueError(f"Payload size exceeds maximum of {MAX_PAYLOAD_BYTES} bytes")
+
+        self._payload_json = payload_json
+        return self
+
+    @property
+    def payload_json(self) -> Optional[bytes]:
+        """Payload encoded as JSON during validation, or None if it was not needed."""
+        return self._payload_json
+
 
 class EventResponse(BaseSchema):
     """Response after event ingestion."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_id: UUID = Field(..., description="Created event ID")
     status: str = Field(default="accepted", description="Ingestion status")
     message: str = Field(default="Event ingested successfully", description="Status message")
     correlation_id: str = Field(..., description="Request correlation ID")
 
 
+class BatchEventError(BaseSchema):
+    """A single rejected event within a batch."""
+
+    model_config = ConfigDict(frozen=True)
+
+    index: int = Field(..., description="Position of the event in the submitted batch")
+    idempotency_key: str = Field(..., description="Idempotency key of the rejected event")
+    error: str = Field(..., description="Reason the event was rejected")
+    status_code: int = Field(..., description="HTTP status the event would have received on its own")
+
+
+class BatchEventResponse(BaseSchema):
+    """Response after batch event ingestion."""
+
+    model_config = ConfigDict(frozen=True)
+
+    processed: int = Field(..., description="Number of events stored")
+    failed: int = Field(..., description="Number of events rejected")
+    event_ids: List[UUID] = Field(default_factory=list, description="IDs of stored events")
+    errors: List[BatchEventError] = Field(default_factory=list, description="Rejected events")
+    correlation_id: str = Field(..., description="Request correlation ID")
+
+
 class HealthResponse(BaseSchema):
     """Health check response."""
 
     status: str = Field(..., description="Health status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Check timestamp")
 
 
 class ReadinessResponse(BaseSchema):
@@ -77,4 +177,8 @@ class ReadinessResponse(BaseSchema):
     status: str = Field(..., description="Readiness status")
     database: str = Field(..., description="Database status")
     redis: str = Field(default="ok", description="Redis status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Check timestamp")
+
+
+# Parses a JSON array of events in one pydantic-core pass (used by POST /events/batch)
+WorkflowEventListAdapter: TypeAdapter[List[WorkflowEventV1]] = TypeAdapter(List[WorkflowEventV1])
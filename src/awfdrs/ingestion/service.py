@@ -2,23 +2,43 @@
 Event ingestion service.
 """
 
+import asyncio
+import functools
 import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from uuid import UUID, uuid4
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.awfdrs.ingestion.schemas import WorkflowEventV1, EventResponse
+from src.awfdrs.ingestion.schemas import (
+    WorkflowEventV1,
+    EventResponse,
+    BatchEventError,
+    BatchEventResponse
+)
 from src.awfdrs.ingestion.validators import (
-    validate_schema_version,
-    validate_tenant_exists,
-    validate_workflow_exists,
-    validate_idempotency_key,
-    validate_payload_structure
+    validate_tenant_state,
+    validate_workflow_state
 )
+from src.awfdrs.config import settings
+from src.awfdrs.core.cache import LookupCache, get_redis_client
+from src.awfdrs.db.session import AsyncSessionLocal
+from src.awfdrs.db.models.tenants import Tenant
+from src.awfdrs.db.models.workflows import Workflow
 from src.awfdrs.db.repositories.events import EventRepository
-from src.awfdrs.core.exceptions import AWFDRSException
+from src.awfdrs.db.repositories.tenants import TenantRepository
+from src.awfdrs.db.repositories.workflows import WorkflowRepository
+from src.awfdrs.core.exceptions import AWFDRSException, ConflictError
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _uuid_str(value: UUID) -> str:
+    """Format a tenant/workflow ID for logging; the same IDs recur on most events."""
+    return str(value)
+
+
 class IngestionService:
     """
     Service for ingesting workflow events.
@@ -26,23 +46,35 @@ class IngestionService:
     Handles validation, deduplication, and storage of events.
     """
 
-    def __init__(self, session: AsyncSession, correlation_id: str = "") -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        correlation_id: str = "",
+        cache: Optional[LookupCache] = None
+    ) -> None:
         """
         Initialize service.
 
         Args:
             session: Database session
             correlation_id: Request correlation ID
+            cache: Tenant/workflow status cache, or None to always query the database
         """
         self.session = session
         self.correlation_id = correlation_id
+        self.cache = cache
         self.event_repo = EventRepository(session)
+        self.tenant_repo = TenantRepository(session)
+        self.workflow_repo = WorkflowRepository(session)
 
     async def ingest_event(self, event: WorkflowEventV1) -> EventResponse:
         """
         Ingest a workflow event.
 
-        Validates event and stores it in the database.
+        Validates event and stores it in the database. While the ingestion
+        buffer is running the event is written together with other
+        concurrently submitted events; otherwise it is written in the
+        request's own session.
 
         Args:
             event: Event to ingest
@@ -60,52 +92,31 @@ class IngestionService:
             f"Ingesting event: {event.event_type}",
             extra={
                 "correlation_id": self.correlation_id,
-                "tenant_id": str(event.tenant_id),
-                "workflow_id": str(event.workflow_id),
+                "tenant_id": _uuid_str(event.tenant_id),
+                "workflow_id": _uuid_str(event.workflow_id),
                 "event_type": event.event_type,
                 "idempotency_key": event.idempotency_key
             }
         )
 
         try:
-            # Validate schema version
-            await validate_schema_version(event.schema_version)
-
-            # Validate payload structure
-            await validate_payload_structure(event.payload)
-
-            # Validate tenant exists and is active
-            await validate_tenant_exists(self.session, event.tenant_id)
-
-            # Validate workflow exists and is not kill-switched
-            await validate_workflow_exists(self.session, event.workflow_id)
-
-            # Validate idempotency key (will raise ConflictError if duplicate)
-            await validate_idempotency_key(self.session, event.idempotency_key)
-
-            # Create event in database
-            created_event = await self.event_repo.create_event(
-                tenant_id=event.tenant_id,
-                workflow_id=event.workflow_id,
-                event_type=event.event_type,
-                payload=event.payload,
-                idempotency_key=event.idempotency_key,
-                occurred_at=event.occurred_at,
-                schema_version=event.schema_version,
-                correlation_id=self.correlation_id
-            )
+            if _flusher.running:
+                # Coalesced with concurrent requests into one batched insert
+                event_id = await _flusher.submit(event, self.correlation_id)
+            else:
+                event_id = await self._ingest_direct(event)
 
             logger.info(
-                f"Event ingested successfully: {created_event.id}",
+                f"Event ingested successfully: {event_id}",
                 extra={
                     "correlation_id": self.correlation_id,
-                    "event_id": str(created_event.id),
-                    "tenant_id": str(event.tenant_id)
+                    "event_id": str(event_id),
+                    "tenant_id": _uuid_str(event.tenant_id)
                 }
             )
 
             return EventResponse(
-                event_id=created_event.id,
+                event_id=event_id,
                 status="accepted",
                 message="Event ingested successfully",
                 correlation_id=self.correlation_id
@@ -132,3 +143,418 @@ class IngestionService:
                 exc_info=True
             )
             raise
+
+    async def _ingest_direct(self, event: WorkflowEventV1) -> UUID:
+        """
+        Validate and store a single event in the request's session.
+
+        Args:
+            event: Event to ingest
+
+        Returns:
+            ID of the created event
+        """
+        # Schema version and payload were already checked when
+        # WorkflowEventV1 was parsed
+
+        # Validate tenant and workflow in at most one round-trip
+        await self._preflight(event)
+
+        # Create event in database (raises ConflictError on a duplicate key)
+        created_event = await self.event_repo.create_event(
+            tenant_id=event.tenant_id,
+            workflow_id=event.workflow_id,
+            event_type=event.event_type,
+            payload=event.payload,
+            serialized_payload=event.payload_json,
+            idempotency_key=event.idempotency_key,
+            occurred_at=event.occurred_at,
+            schema_version=event.schema_version,
+            correlation_id=self.correlation_id
+        )
+        return created_event.id
+
+    async def _preflight(self, event: WorkflowEventV1) -> None:
+        """
+        Validate tenant and workflow for a single event.
+
+        When both statuses are cached, no database query is needed.
+        Otherwise both are read with one SELECT of scalar subqueries, which
+        returns a row (with NULLs) even when the tenant or workflow does not
+        exist. Duplicate idempotency keys are detected by the insert itself.
+
+        Args:
+            event: Event to validate
+
+        Raises:
+            NotFoundError: If tenant or workflow not found
+            ValidationError: If tenant is not active
+            KillSwitchActiveError: If workflow is kill-switched
+        """
+        if self.cache is not None:
+            is_active, is_kill_switched = await self.cache.get_event_states(
+                event.tenant_id, event.workflow_id
+            )
+            if is_active is not None and is_kill_switched is not None:
+                validate_tenant_state(event.tenant_id, is_active)
+                validate_workflow_state(event.workflow_id, is_kill_switched)
+                return
+
+        result = await self.session.execute(
+            select(
+                select(Tenant.is_active)
+                .where(Tenant.id == event.tenant_id)
+                .scalar_subquery()
+                .label("is_active"),
+                select(Workflow.is_kill_switched)
+                .where(Workflow.id == event.workflow_id)
+                .scalar_subquery()
+                .label("is_kill_switched")
+            )
+        )
+        row = result.one()
+
+        if self.cache is not None:
+            if row.is_active is not None:
+                await self.cache.set_tenant_states({event.tenant_id: row.is_active})
+            if row.is_kill_switched is not None:
+                await self.cache.set_workflow_states(
+                    {event.workflow_id: row.is_kill_switched}
+                )
+
+        validate_tenant_state(event.tenant_id, row.is_active)
+        validate_workflow_state(event.workflow_id, row.is_kill_switched)
+
+    async def ingest_events_batch(
+        self,
+        events: List[WorkflowEventV1]
+    ) -> BatchEventResponse:
+        """
+        Ingest a batch of workflow events.
+
+        Each event is validated on its own, but tenant, workflow and
+        idempotency lookups and the insert are issued once for the whole
+        batch. Rejected events are reported without failing the rest.
+
+        Args:
+            events: Events to ingest
+
+        Returns:
+            BatchEventResponse with stored event IDs and per-event errors
+        """
+        logger.info(
+            f"Ingesting batch of {len(events)} events",
+            extra={
+                "correlation_id": self.correlation_id,
+                "batch_size": len(events)
+            }
+        )
+
+        outcomes = await self._ingest_batch(events, [self.correlation_id] * len(events))
+
+        event_ids: List[UUID] = []
+        errors: List[BatchEventError] = []
+        for index, (event, outcome) in enumerate(zip(events, outcomes)):
+            if isinstance(outcome, AWFDRSException):
+                errors.append(BatchEventError(
+                    index=index,
+                    idempotency_key=event.idempotency_key,
+                    error=outcome.message,
+                    status_code=outcome.status_code
+                ))
+            else:
+                event_ids.append(outcome)
+
+        logger.info(
+            f"Batch ingested: {len(event_ids)} stored, {len(errors)} rejected",
+            extra={
+                "correlation_id": self.correlation_id,
+                "processed": len(event_ids),
+                "failed": len(errors)
+            }
+        )
+
+        return BatchEventResponse(
+            processed=len(event_ids),
+            failed=len(errors),
+            event_ids=event_ids,
+            errors=errors,
+            correlation_id=self.correlation_id
+        )
+
+    async def _ingest_batch(
+        self,
+        events: Sequence[WorkflowEventV1],
+        correlation_ids: Sequence[str]
+    ) -> List[Union[UUID, AWFDRSException]]:
+        """
+        Validate and store events using one round-trip per lookup.
+
+        Args:
+            events: Events to ingest
+            correlation_ids: Correlation ID to store with each event
+
+        Returns:
+            For each event, in order, the new event ID or the error that rejected it
+        """
+        outcomes: List[Union[UUID, AWFDRSException]] = []
+        if not events:
+            return outcomes
+
+        tenant_states = await self._get_states(
+            {event.tenant_id for event in events},
+            self.tenant_repo.get_active_states,
+            self.cache.get_tenant_states if self.cache else None,
+            self.cache.set_tenant_states if self.cache else None
+        )
+        workflow_states = await self._get_states(
+            {event.workflow_id for event in events},
+            self.workflow_repo.get_kill_switch_states,
+            self.cache.get_workflow_states if self.cache else None,
+            self.cache.set_workflow_states if self.cache else None
+        )
+        seen_keys = await self.event_repo.get_existing_idempotency_keys(
+            event.idempotency_key for event in events
+        )
+
+        rows = []
+        for event, correlation_id in zip(events, correlation_ids):
+            try:
+                validate_tenant_state(event.tenant_id, tenant_states.get(event.tenant_id))
+                validate_workflow_state(event.workflow_id, workflow_states.get(event.workflow_id))
+                if event.idempotency_key in seen_keys:
+                    raise ConflictError(
+                        f"Event with idempotency key already exists: {event.idempotency_key}",
+                        details={"idempotency_key": event.idempotency_key}
+                    )
+            except AWFDRSException as e:
+                outcomes.append(e)
+                continue
+
+            # Later events in the same batch with this key are duplicates too
+            seen_keys.add(event.idempotency_key)
+
+            event_id = uuid4()
+            rows.append({
+                "id": event_id,
+                "tenant_id": event.tenant_id,
+                "workflow_id": event.workflow_id,
+                "event_type": event.event_type,
+                "payload": event.payload_json or event.payload,
+                "idempotency_key": event.idempotency_key,
+                "occurred_at": event.occurred_at,
+                "schema_version": event.schema_version,
+                "correlation_id": correlation_id
+            })
+            outcomes.append(event_id)
+
+        # A key stored by a concurrent writer since the lookup above is
+        # skipped by the insert; only that event is reported as a conflict
+        inserted_keys = await self.event_repo.create_events(rows)
+        for index, event in enumerate(events):
+            if isinstance(outcomes[index], UUID) and event.idempotency_key not in inserted_keys:
+                outcomes[index] = ConflictError(
+                    f"Event with idempotency key already exists: {event.idempotency_key}",
+                    details={"idempotency_key": event.idempotency_key}
+                )
+        return outcomes
+
+    @staticmethod
+    async def _get_states(
+        ids: Set[UUID],
+        load: Callable[[Iterable[UUID]], Awaitable[Dict[UUID, bool]]],
+        cache_get: Optional[Callable[[Iterable[UUID]], Awaitable[Dict[UUID, bool]]]],
+        cache_set: Optional[Callable[[Dict[UUID, bool]], Awaitable[None]]]
+    ) -> Dict[UUID, bool]:
+        """
+        Resolve status flags from the cache, loading only misses from the database.
+
+        Args:
+            ids: IDs to resolve
+            load: Repository method returning flags for existing rows
+            cache_get: Cache read, or None when caching is disabled
+            cache_set: Cache write, or None when caching is disabled
+
+        Returns:
+            Mapping of ID to flag; unknown IDs are absent
+        """
+        states = await cache_get(ids) if cache_get else {}
+        missing = ids - states.keys()
+        if missing:
+            loaded = await load(missing)
+            if cache_set:
+                await cache_set(loaded)
+            states.update(loaded)
+        return states
+
+
+_QueuedEvent = Tuple[WorkflowEventV1, str, "asyncio.Future[UUID]"]
+
+
+class _BufferedFlusher:
+    """
+    Coalesces events from concurrent requests into batched inserts.
+
+    Events queued within batch_ms of the first one (up to batch_size) are
+    stored by a single IngestionService._ingest_batch call and committed in
+    one transaction. Each caller awaits a future resolved with its event ID
+    or the error that rejected its event.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle flusher."""
+        self._queue: Optional["asyncio.Queue[Optional[_QueuedEvent]]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._batch_size = 1
+        self._batch_wait = 0.0
+        self._cache: Optional[LookupCache] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is accepting events."""
+        return self._task is not None and not self._task.done()
+
+    def start(
+        self,
+        batch_size: int,
+        batch_ms: int,
+        cache: Optional[LookupCache] = None
+    ) -> None:
+        """
+        Start the background flush task.
+
+        Args:
+            batch_size: Maximum events per insert
+            batch_ms: Milliseconds to wait for a batch to fill
+            cache: Tenant/workflow status cache used by each flush
+        """
+        if self.running:
+            return
+        self._cache = cache
+        self._batch_size = max(1, batch_size)
+        self._batch_wait = batch_ms / 1000
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush all queued events and stop the background task."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, event: WorkflowEventV1, correlation_id: str) -> UUID:
+        """
+        Queue an event and wait until its batch is flushed.
+
+        Args:
+            event: Event to ingest
+            correlation_id: Correlation ID of the submitting request
+
+        Returns:
+            ID of the created event
+
+        Raises:
+            AWFDRSException: If the event was rejected
+        """
+        future: "asyncio.Future[UUID]" = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((event, correlation_id, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect batches until a stop sentinel arrives, then drain the queue."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self._batch_wait
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+        # Events queued behind the stop sentinel still get written
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self._batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None:
+                    batch.append(item)
+            if batch:
+                await self._flush(batch)
+
+    async def _flush(self, batch: List[_QueuedEvent]) -> None:
+        """
+        Store a batch in its own session and resolve the callers' futures.
+
+        Per-event rejections, including idempotency keys stored concurrently,
+        come back from _ingest_batch as outcomes and only fail their own
+        caller. An exception here means the batch as a whole could not be
+        written (e.g. the database is unreachable), so every caller gets it
+        unchanged rather than a per-event error such as a conflict.
+
+        Args:
+            batch: Queued events with their correlation IDs and futures
+        """
+        events = [event for event, _, _ in batch]
+        correlation_ids = [correlation_id for _, correlation_id, _ in batch]
+
+        try:
+            async with AsyncSessionLocal() as session:
+                service = IngestionService(session, cache=self._cache)
+                outcomes = await service._ingest_batch(
+                    events, correlation_ids
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                f"Buffered ingestion flush failed: {str(e)}",
+                extra={"batch_size": len(batch), "error": str(e)},
+                exc_info=True
+            )
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), outcome in zip(batch, outcomes):
+            # A caller that disconnected has already cancelled its future
+            if future.done():
+                continue
+            if isinstance(outcome, AWFDRSException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+_flusher = _BufferedFlusher()
+
+
+def start_ingestion_buffer() -> None:
+    """Start coalescing single-event ingestion into batched inserts."""
+    _flusher.start(
+        settings.ingestion.batch_size,
+        settings.ingestion.batch_ms,
+        LookupCache(get_redis_client())
+    )
+
+
+async def stop_ingestion_buffer() -> None:
+    """Flush buffered events and fall back to per-request inserts."""
+    await _flusher.stop()
@@ -5,13 +5,15 @@ FastAPI application entry point.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.awfdrs.config import settings
 from src.awfdrs.core.logging import setup_logging
 from src.awfdrs.core.tracing import CorrelationIDMiddleware, RequestLoggingMiddleware
 from src.awfdrs.core.exceptions import AWFDRSException
+from src.awfdrs.core.cache import close_redis
 from src.awfdrs.db.session import close_db
+from src.awfdrs.ingestion.service import start_ingestion_buffer, stop_ingestion_buffer
 
 # Import routers
 from src.awfdrs.ingestion.api.v1.events import router as events_router
@@ -29,8 +31,12 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     setup_logging(settings.log_level, use_json=True)
+    if settings.ingestion.buffer_enabled:
+        start_ingestion_buffer()
     yield
     # Shutdown
+    await stop_ingestion_buffer()
+    await close_redis()
     await close_db()
 
 
@@ -39,6 +45,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Autonomous Workflow Failure Detection & Recovery System",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -60,9 +67,9 @@ app.add_middleware(RequestLoggingMiddleware)
 @app.exception_handler(AWFDRSException)
 async def awfdrs_exception_handler(request: Request, exc: AWFDRSException):
     """Handle custom AWFDRS exceptions."""
-    correlation_id = getattr(request.state, "correlation_id", "unknown")
+    correlation_id = request.scope.get("state", {}).get("correlation_id", "unknown")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.message,
@@ -75,9 +82,9 @@ async def awfdrs_exception_handler(request: Request, exc: AWFDRSException):
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     """Handle generic exceptions."""
-    correlation_id = getattr(request.state, "correlation_id", "unknown")
+    correlation_id = request.scope.get("state", {}).get("correlation_id", "unknown")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
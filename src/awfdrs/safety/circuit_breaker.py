@@ -2,15 +2,14 @@
 Circuit breaker manager for vendor protection.
 """
 
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from uuid import UUID
-from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.awfdrs.core.enums import CircuitBreakerState
 from src.awfdrs.db.repositories.vendors import VendorRepository
+from src.awfdrs.safety.config_loader import load_vendor_configs
 from src.awfdrs.config import settings
 
 
@@ -39,17 +38,17 @@ class CircuitBreakerManager:
         self.session = session
         self.vendor_repo = VendorRepository(session)
         self.config_dir = Path(config_dir)
-        self.vendor_configs: Dict[str, Any] = {}
-        self._load_vendor_configs()
-
-    def _load_vendor_configs(self) -> None:
-        """Load vendor configurations from YAML."""
-        vendor_config_file = self.config_dir / "vendor_config.yaml"
-        if vendor_config_file.exists():
-            with open(vendor_config_file, 'r') as f:
-                data = yaml.safe_load(f)
-                vendors = data.get('vendors', [])
-                self.vendor_configs = {v['name']: v for v in vendors}
+        self.vendor_configs: Dict[str, Any] = load_vendor_configs(str(config_dir))
+        self._failure_thresholds = self._circuit_breaker_overrides('failure_threshold')
+        self._timeouts = self._circuit_breaker_overrides('timeout_seconds')
+
+    def _circuit_breaker_overrides(self, key: str) -> Dict[str, Any]:
+        """Collect a circuit_breaker setting from every vendor that configures it."""
+        return {
+            name: config['circuit_breaker'][key]
+            for name, config in self.vendor_configs.items()
+            if key in config.get('circuit_breaker', {})
+        }
 
     async def record_failure(self, vendor_id: UUID) -> CircuitBreakerState:
         """
@@ -61,34 +60,16 @@ class CircuitBreakerManager:
         Returns:
             New circuit breaker state
         """
-        vendor = await self.vendor_repo.get(vendor_id)
+        # Increment failure count and open the circuit if the vendor's
+        # threshold is reached, in one UPDATE
+        vendor = await self.vendor_repo.record_failure(
+            vendor_id,
+            settings.safety.circuit_breaker_threshold,
+            threshold_overrides=self._failure_thresholds
+        )
         if not vendor:
             return CircuitBreakerState.CLOSED
 
-        # Get vendor configuration
-        vendor_config = self.vendor_configs.get(vendor.name, {})
-        failure_threshold = vendor_config.get(
-            'circuit_breaker',
-            {}
-        ).get('failure_threshold', settings.safety.circuit_breaker_threshold)
-
-        # Increment failure count
-        vendor = await self.vendor_repo.increment_failure_count(vendor_id)
-        if not vendor:
-            return CircuitBreakerState.CLOSED
-
-        # Check if should open circuit breaker
-        if (
-            vendor.circuit_breaker_state == CircuitBreakerState.CLOSED and
-            vendor.failure_count >= failure_threshold
-        ):
-            # Open circuit breaker
-            vendor = await self.vendor_repo.update_circuit_breaker_state(
-                vendor_id,
-                CircuitBreakerState.OPEN
-            )
-            return CircuitBreakerState.OPEN
-
         return vendor.circuit_breaker_state
 
     async def record_success(self, vendor_id: UUID) -> CircuitBreakerState:
@@ -101,23 +82,12 @@ class CircuitBreakerManager:
         Returns:
             New circuit breaker state
         """
-        vendor = await self.vendor_repo.get(vendor_id)
+        # HALF_OPEN and CLOSED both close with a reset failure count;
+        # an OPEN circuit is left for check_state to move to HALF_OPEN
+        vendor = await self.vendor_repo.record_success(vendor_id)
         if not vendor:
             return CircuitBreakerState.CLOSED
 
-        # If in HALF_OPEN, success means we can close the circuit
-        if vendor.circuit_breaker_state == CircuitBreakerState.HALF_OPEN:
-            await self.vendor_repo.reset_failure_count(vendor_id)
-            vendor = await self.vendor_repo.update_circuit_breaker_state(
-                vendor_id,
-                CircuitBreakerState.CLOSED
-            )
-            return CircuitBreakerState.CLOSED
-
-        # In CLOSED state, just reset failure count
-        if vendor.circuit_breaker_state == CircuitBreakerState.CLOSED:
-            await self.vendor_repo.reset_failure_count(vendor_id)
-
         return vendor.circuit_breaker_state
 
     async def check_state(self, vendor_id: UUID) -> CircuitBreakerState:
@@ -132,29 +102,15 @@ class CircuitBreakerManager:
         Returns:
             Current circuit breaker state
         """
-        vendor = await self.vendor_repo.get(vendor_id)
-        if not vendor:
+        state = await self.vendor_repo.check_open_timeout(
+            vendor_id,
+            settings.safety.circuit_breaker_timeout_seconds,
+            timeout_overrides=self._timeouts
+        )
+        if state is None:
             return CircuitBreakerState.CLOSED
 
-        # If OPEN, check if timeout has elapsed
-        if vendor.circuit_breaker_state == CircuitBreakerState.OPEN:
-            if vendor.last_failure_at:
-                vendor_config = self.vendor_configs.get(vendor.name, {})
-                timeout_seconds = vendor_config.get(
-                    'circuit_breaker',
-                    {}
-                ).get('timeout_seconds', settings.safety.circuit_breaker_timeout_seconds)
-
-                elapsed = (datetime.utcnow() - vendor.last_failure_at).total_seconds()
-                if elapsed >= timeout_seconds:
-                    # Transition to HALF_OPEN for testing
-                    vendor = await self.vendor_repo.update_circuit_breaker_state(
-                        vendor_id,
-                        CircuitBreakerState.HALF_OPEN
-                    )
-                    return CircuitBreakerState.HALF_OPEN
-
-        return vendor.circuit_breaker_state
+        return CircuitBreakerState(state)
 
     async def should_allow_request(self, vendor_id: UUID) -> bool:
         """
@@ -194,9 +150,9 @@ class CircuitBreakerManager:
             return await self.record_success(vendor_id)
         else:
             # Failure in HALF_OPEN means go back to OPEN
-            vendor = await self.vendor_repo.update_circuit_breaker_state(
+            await self.vendor_repo.record_failure(
                 vendor_id,
-                CircuitBreakerState.OPEN
+                settings.safety.circuit_breaker_threshold,
+                open_circuit=True
             )
-            await self.vendor_repo.increment_failure_count(vendor_id)
             return CircuitBreakerState.OPEN
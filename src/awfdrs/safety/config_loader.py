@@ -0,0 +1,49 @@
+"""
+Cached loading of the YAML rule configuration shared by safety components.
+"""
+
+import functools
+import yaml
+from pathlib import Path
+from typing import Dict, Any
+
+# libyaml-backed loader when available; falls back to the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def load_yaml_section(config_dir: str, filename: str, section: str) -> Any:
+    """
+    Load one top-level section of a YAML config file, once per process.
+
+    Args:
+        config_dir: Directory containing the configuration files
+        filename: YAML file name within config_dir
+        section: Top-level key to return
+
+    Returns:
+        The section's value (shared between callers; do not mutate), or an
+        empty dict if the file or section is missing
+    """
+    config_file = Path(config_dir) / filename
+    if not config_file.exists():
+        return {}
+
+    with open(config_file, 'r') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    return data.get(section, {})
+
+
+@functools.lru_cache(maxsize=None)
+def load_vendor_configs(config_dir: str) -> Dict[str, Any]:
+    """
+    Load vendor configurations from vendor_config.yaml, once per process.
+
+    Args:
+        config_dir: Directory containing vendor_config.yaml
+
+    Returns:
+        Vendor configurations keyed by vendor name (shared; do not mutate)
+    """
+    vendors = load_yaml_section(config_dir, "vendor_config.yaml", "vendors") or []
+    return {v['name']: v for v in vendors}
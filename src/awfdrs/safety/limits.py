@@ -2,12 +2,109 @@
 Safety limits enforcement for workflow and vendor operations.
 """
 
-from typing import Optional
+import functools
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from datetime import datetime, timedelta
 
 from src.awfdrs.config import settings
+from src.awfdrs.core.cache import get_redis_client
+
+# Default per-tenant daily quotas by resource type; None means unlimited
+TENANT_QUOTAS: Dict[str, Optional[int]] = {
+    'events': 10000,
+    'incidents': 1000,
+    'actions': 5000
+}
+DEFAULT_TENANT_QUOTA = 10000
+
+# Increments a counter, setting its TTL only when the counter is created, so
+# the window runs from the first hit instead of being re-armed on every hit.
+# KEYS[1] = counter key; ARGV[1] = window in seconds. Returns the new count.
+INCREMENT_SCRIPT = b"""
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# Atomically compares a counter with its limit and increments it if allowed.
+# The TTL is only set on the first increment, so the window runs from the
+# first hit rather than being re-armed on every hit.
+# KEYS[1] = counter key; ARGV[1] = limit; ARGV[2] = window in seconds.
+# Returns {1, new_count} if allowed, {0, current_count} if the limit is reached.
+CHECK_AND_INCREMENT_SCRIPT = b"""
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current >= tonumber(ARGV[1]) then
+    return {0, current}
+end
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return {1, count}
+"""
+
+# Records one hit against several counters only if every one is below its
+# limit, so a retry denied by one limit does not use up the others.
+# KEYS[i] = counter key; ARGV[2i-1] = its limit; ARGV[2i] = its window.
+# Returns a 1/0 flag per key; nothing is incremented unless all flags are 1.
+CHECK_AND_INCREMENT_ALL_SCRIPT = b"""
+local allowed = {}
+local all_allowed = true
+for i, key in ipairs(KEYS) do
+    local current = tonumber(redis.call('GET', key) or '0')
+    if current >= tonumber(ARGV[2 * i - 1]) then
+        allowed[i] = 0
+        all_allowed = false
+    else
+        allowed[i] = 1
+    end
+end
+if all_allowed then
+    for i, key in ipairs(KEYS) do
+        if redis.call('INCR', key) == 1 then
+            redis.call('EXPIRE', key, ARGV[2 * i])
+        end
+    end
+end
+return allowed
+"""
+
+# Hashed once at import and run with EVALSHA against whichever client is
+# passed in; redis-py loads the script on the first NOSCRIPT reply.
+_INCREMENT = AsyncScript(None, INCREMENT_SCRIPT)
+_CHECK_AND_INCREMENT = AsyncScript(None, CHECK_AND_INCREMENT_SCRIPT)
+_CHECK_AND_INCREMENT_ALL = AsyncScript(None, CHECK_AND_INCREMENT_ALL_SCRIPT)
+
+
+@functools.lru_cache(maxsize=8192)
+def _counter_key(kind: str, id_: UUID, resource: Optional[str] = None) -> str:
+    """Build 'safety:{kind}:{id}[:{resource}]'; the same IDs recur across checks."""
+    if resource is None:
+        return f"safety:{kind}:{id_}"
+    return f"safety:{kind}:{id_}:{resource}"
+
+
+def _decided_without_redis(limit: Optional[int]) -> Optional[bool]:
+    """
+    Decide a limit check that needs no counter lookup.
+
+    Args:
+        limit: Maximum count allowed, or None for unlimited
+
+    Returns:
+        True for an unlimited limit, False for a limit of zero or less,
+        None when the counter has to be read
+    """
+    if limit is None:
+        return True
+    if limit <= 0:
+        return False
+    return None
 
 
 class SafetyLimitsEnforcer:
@@ -22,31 +119,82 @@ class SafetyLimitsEnforcer:
         Initialize safety limits enforcer.
 
         Args:
-            redis_client: Redis client instance
+            redis_client: Redis client instance; defaults to the shared
+                process-wide client and its connection pool
+        """
+        self._shared_client = redis_client is None
+        self.redis_client = redis_client if redis_client is not None else get_redis_client()
+        # Settings are fixed at runtime; read them once rather than per check
+        self._max_workflow_retries = settings.safety.max_retries_per_workflow
+        self._max_vendor_retries = settings.safety.max_retries_per_vendor
+
+    async def _bump(self, key: str, window_seconds: int) -> int:
+        """
+        Increment a counter in one command, starting its window on the first hit.
+
+        Args:
+            key: Counter key
+            window_seconds: Window length, applied when the counter is created
+
+        Returns:
+            New count, or 0 if Redis is unavailable
+        """
+        try:
+            return int(await _INCREMENT(
+                keys=[key],
+                args=[window_seconds],
+                client=self.redis_client
+            ))
+
+        except Exception:
+            return 0
+
+    async def _check_and_bump(
+        self,
+        key: str,
+        limit: Optional[int],
+        window_seconds: int
+    ) -> Tuple[bool, int]:
+        """
+        Check a counter against its limit and increment it in one round-trip.
+
+        Unlimited and zero limits are decided without touching Redis.
+
+        Args:
+            key: Counter key
+            limit: Maximum count allowed within the window, or None for unlimited
+            window_seconds: Window length, applied when the counter is created
+
+        Returns:
+            (allowed, count): the new count if allowed, else the current count
         """
-        self.redis_client = redis_client
+        decided = _decided_without_redis(limit)
+        if decided is not None:
+            return decided, 0
 
-    async def _get_redis_client(self) -> redis.Redis:
-        """Get or create Redis client."""
-        if self.redis_client is None:
-            self.redis_client = redis.from_url(
-                settings.redis.url,
-                encoding="utf-8",
-                decode_responses=True
+        try:
+            allowed, count = await _CHECK_AND_INCREMENT(
+                keys=[key],
+                args=[limit, window_seconds],
+                client=self.redis_client
             )
-        return self.redis_client
+            return bool(allowed), int(count)
+
+        except Exception:
+            # If Redis fails, allow (fail open)
+            return True, 0
 
     def _get_workflow_retry_key(self, workflow_id: UUID) -> str:
         """Generate Redis key for workflow retry tracking."""
-        return f"safety:workflow_retries:{workflow_id}"
+        return _counter_key("workflow_retries", workflow_id)
 
     def _get_vendor_retry_key(self, vendor_id: UUID) -> str:
         """Generate Redis key for vendor retry tracking."""
-        return f"safety:vendor_retries:{vendor_id}"
+        return _counter_key("vendor_retries", vendor_id)
 
     def _get_tenant_quota_key(self, tenant_id: UUID, resource: str) -> str:
         """Generate Redis key for tenant quota tracking."""
-        return f"safety:tenant_quota:{tenant_id}:{resource}"
+        return _counter_key("tenant_quota", tenant_id, resource)
 
     async def check_workflow_retry_limit(self, workflow_id: UUID) -> bool:
         """
@@ -58,14 +206,17 @@ class SafetyLimitsEnforcer:
         Returns:
             True if within limit, False if exceeded
         """
-        redis_client = await self._get_redis_client()
+        decided = _decided_without_redis(self._max_workflow_retries)
+        if decided is not None:
+            return decided
+
         key = self._get_workflow_retry_key(workflow_id)
         window_seconds = 3600  # 1 hour window
 
         try:
-            current_count = await redis_client.get(key)
+            current_count = await self.redis_client.get(key)
             current_count = int(current_count) if current_count else 0
-            return current_count < settings.safety.max_retries_per_workflow
+            return current_count < self._max_workflow_retries
 
         except Exception:
             # If Redis fails, allow (fail open)
@@ -81,19 +232,28 @@ class SafetyLimitsEnforcer:
         Returns:
             New retry count
         """
-        redis_client = await self._get_redis_client()
         key = self._get_workflow_retry_key(workflow_id)
         window_seconds = 3600  # 1 hour window
 
-        try:
-            pipe = redis_client.pipeline()
-            pipe.incr(key)
-            pipe.expire(key, window_seconds)
-            results = await pipe.execute()
-            return results[0]
+        return await self._bump(key, window_seconds)
 
-        except Exception:
-            return 0
+    async def check_and_increment_workflow_retry(self, workflow_id: UUID) -> bool:
+        """
+        Record a workflow retry if it is within the retry limit.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            True if the retry was recorded, False if the limit is reached
+        """
+        key = self._get_workflow_retry_key(workflow_id)
+        window_seconds = 3600  # 1 hour window
+
+        allowed, _ = await self._check_and_bump(
+            key, self._max_workflow_retries, window_seconds
+        )
+        return allowed
 
     async def check_vendor_retry_limit(self, vendor_id: UUID) -> bool:
         """
@@ -105,14 +265,17 @@ class SafetyLimitsEnforcer:
         Returns:
             True if within limit, False if exceeded
         """
-        redis_client = await self._get_redis_client()
+        decided = _decided_without_redis(self._max_vendor_retries)
+        if decided is not None:
+            return decided
+
         key = self._get_vendor_retry_key(vendor_id)
         window_seconds = 3600  # 1 hour window
 
         try:
-            current_count = await redis_client.get(key)
+            current_count = await self.redis_client.get(key)
             current_count = int(current_count) if current_count else 0
-            return current_count < settings.safety.max_retries_per_vendor
+            return current_count < self._max_vendor_retries
 
         except Exception:
             # If Redis fails, allow (fail open)
@@ -128,19 +291,80 @@ class SafetyLimitsEnforcer:
         Returns:
             New retry count
         """
-        redis_client = await self._get_redis_client()
         key = self._get_vendor_retry_key(vendor_id)
         window_seconds = 3600  # 1 hour window
 
-        try:
-            pipe = redis_client.pipeline()
-            pipe.incr(key)
-            pipe.expire(key, window_seconds)
-            results = await pipe.execute()
-            return results[0]
+        return await self._bump(key, window_seconds)
 
-        except Exception:
-            return 0
+    async def check_and_increment_vendor_retry(self, vendor_id: UUID) -> bool:
+        """
+        Record a vendor retry if it is within the retry limit.
+
+        Args:
+            vendor_id: Vendor ID
+
+        Returns:
+            True if the retry was recorded, False if the limit is reached
+        """
+        key = self._get_vendor_retry_key(vendor_id)
+        window_seconds = 3600  # 1 hour window
+
+        allowed, _ = await self._check_and_bump(
+            key, self._max_vendor_retries, window_seconds
+        )
+        return allowed
+
+    async def check_and_increment_retries(
+        self,
+        workflow_id: UUID,
+        vendor_id: Optional[UUID]
+    ) -> Tuple[bool, bool]:
+        """
+        Record a retry against the workflow and vendor retry limits together.
+
+        Both counters are checked and, only if both allow the retry,
+        incremented in one atomic script, so a retry denied by the vendor
+        limit does not count against the workflow (and vice versa).
+
+        Args:
+            workflow_id: Workflow ID
+            vendor_id: Vendor ID, or None to check the workflow limit only
+
+        Returns:
+            (workflow_ok, vendor_ok); the retry was recorded only if both are
+            True. A limit that was not evaluated because another one is zero
+            is reported as True.
+        """
+        window_seconds = 3600  # 1 hour window
+        checks = [(self._get_workflow_retry_key(workflow_id), self._max_workflow_retries)]
+        if vendor_id is not None:
+            checks.append((self._get_vendor_retry_key(vendor_id), self._max_vendor_retries))
+
+        # Unlimited and zero limits are decided without reading their counters
+        results = [_decided_without_redis(limit) for _, limit in checks]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if False in results:
+            results = [result is not False for result in results]
+        elif pending:
+            args = []
+            for i in pending:
+                args.extend((checks[i][1], window_seconds))
+            try:
+                allowed = await _CHECK_AND_INCREMENT_ALL(
+                    keys=[checks[i][0] for i in pending],
+                    args=args,
+                    client=self.redis_client
+                )
+                for i, flag in zip(pending, allowed):
+                    results[i] = bool(flag)
+
+            except Exception:
+                # If Redis fails, allow (fail open)
+                return True, True
+
+        workflow_ok = results[0]
+        vendor_ok = vendor_id is None or results[1]
+        return workflow_ok, vendor_ok
 
     async def check_tenant_quota(self, tenant_id: UUID, resource: str) -> bool:
         """
@@ -153,20 +377,16 @@ class SafetyLimitsEnforcer:
         Returns:
             True if within quota, False if exceeded
         """
-        redis_client = await self._get_redis_client()
+        limit = TENANT_QUOTAS.get(resource, DEFAULT_TENANT_QUOTA)
+        decided = _decided_without_redis(limit)
+        if decided is not None:
+            return decided
+
         key = self._get_tenant_quota_key(tenant_id, resource)
         window_seconds = 86400  # 24 hour window
 
-        # Default quotas
-        quotas = {
-            'events': 10000,
-            'incidents': 1000,
-            'actions': 5000
-        }
-        limit = quotas.get(resource, 10000)
-
         try:
-            current_count = await redis_client.get(key)
+            current_count = await self.redis_client.get(key)
             current_count = int(current_count) if current_count else 0
             return current_count < limit
 
@@ -189,21 +409,86 @@ class SafetyLimitsEnforcer:
         Returns:
             New count
         """
-        redis_client = await self._get_redis_client()
         key = self._get_tenant_quota_key(tenant_id, resource)
         window_seconds = 86400  # 24 hour window
 
-        try:
-            pipe = redis_client.pipeline()
-            pipe.incr(key)
-            pipe.expire(key, window_seconds)
-            results = await pipe.execute()
-            return results[0]
+        return await self._bump(key, window_seconds)
 
-        except Exception:
-            return 0
+    async def check_and_increment_tenant_quota(self, tenant_id: UUID, resource: str) -> bool:
+        """
+        Record one unit of tenant resource usage if it is within quota.
+
+        Args:
+            tenant_id: Tenant ID
+            resource: Resource type (e.g., 'events', 'incidents')
+
+        Returns:
+            True if the usage was recorded, False if the quota is exhausted
+        """
+        key = self._get_tenant_quota_key(tenant_id, resource)
+        window_seconds = 86400  # 24 hour window
+
+        limit = TENANT_QUOTAS.get(resource, DEFAULT_TENANT_QUOTA)
+
+        allowed, _ = await self._check_and_bump(key, limit, window_seconds)
+        return allowed
+
+    async def check_all(
+        self,
+        workflow_id: UUID,
+        vendor_id: Optional[UUID],
+        tenant_id: UUID,
+        resource: str
+    ) -> Tuple[bool, bool, bool]:
+        """
+        Check workflow retries, vendor retries and tenant quota in one round-trip.
+
+        Equivalent to calling check_workflow_retry_limit,
+        check_vendor_retry_limit and check_tenant_quota, but reads all three
+        counters with a single MGET.
+
+        Args:
+            workflow_id: Workflow ID
+            vendor_id: Vendor ID, or None to skip the vendor check
+            tenant_id: Tenant ID
+            resource: Resource type for the tenant quota
+
+        Returns:
+            (workflow_ok, vendor_ok, tenant_ok)
+        """
+        checks = [
+            (self._get_workflow_retry_key(workflow_id), self._max_workflow_retries),
+            (
+                self._get_tenant_quota_key(tenant_id, resource),
+                TENANT_QUOTAS.get(resource, DEFAULT_TENANT_QUOTA)
+            )
+        ]
+        if vendor_id is not None:
+            checks.append((self._get_vendor_retry_key(vendor_id), self._max_vendor_retries))
+
+        # Unlimited and zero limits are decided without reading their counters
+        results = [_decided_without_redis(limit) for _, limit in checks]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            try:
+                values = await self.redis_client.mget([checks[i][0] for i in pending])
+
+            except Exception:
+                # If Redis fails, allow (fail open)
+                return True, True, True
+
+            for i, value in zip(pending, values):
+                results[i] = (int(value) if value else 0) < checks[i][1]
+
+        workflow_ok, tenant_ok = results[0], results[1]
+        vendor_ok = vendor_id is None or results[2]
+        return workflow_ok, vendor_ok, tenant_ok
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self.redis_client:
+        """
+        Close an injected Redis client.
+
+        The shared client is left open; it is closed at shutdown by close_redis().
+        """
+        if not self._shared_client:
             await self.redis_client.close()
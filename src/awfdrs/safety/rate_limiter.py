@@ -1,21 +1,64 @@
 """
-Redis-based rate limiter with sliding window algorithm.
+Redis-based rate limiter with token bucket algorithm.
 """
 
-import yaml
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from uuid import UUID
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from datetime import datetime
 
+from src.awfdrs.safety.config_loader import load_vendor_configs
 from src.awfdrs.safety.schemas import RateLimitResult
-from src.awfdrs.config import settings
+from src.awfdrs.core.cache import get_redis_client
+
+# Token bucket per key, stored as a hash {t: tokens, ts: last refill in ms}.
+# Tokens refill continuously up to the capacity, so bursts at a window
+# boundary cannot exceed the limit the way a fixed-window counter allows.
+# Redis server time is used so all app instances share one clock.
+# KEYS[1] = bucket key; ARGV[1] = capacity; ARGV[2] = refill rate in tokens
+# per second; ARGV[3] = 1 to take a token, 0 to only check.
+# Returns {allowed, remaining, retry_after_seconds}; retry_after is -1 when allowed.
+TOKEN_BUCKET_SCRIPT = b"""
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - last) * rate / 1000)
+if tokens < 1 then
+    return {0, 0, math.ceil((1 - tokens) / rate)}
+end
+local remaining = math.floor(tokens - 1)
+if ARGV[3] == '1' then
+    redis.call('HSET', KEYS[1], 't', tostring(tokens - 1), 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate))
+end
+return {1, remaining, -1}
+"""
+
+# Hashed once at import and run with EVALSHA; see safety.limits
+#
+# If a sliding-window limiter is ever added alongside the bucket, its script
+# must count with ZCARD (ZREMRANGEBYSCORE expired entries, ZCARD, ZADD if
+# under the limit) and never return ZRANGE/ZRANGEBYSCORE members to count
+# them client-side.
+_TOKEN_BUCKET = AsyncScript(None, TOKEN_BUCKET_SCRIPT)
+
+
+@functools.lru_cache(maxsize=8192)
+def _bucket_key(vendor: str, tenant_id: UUID) -> str:
+    """Build the bucket key; vendor/tenant pairs recur on every request."""
+    return f"ratelimit:bucket:{vendor}:{tenant_id}"
 
 
 class RateLimiter:
     """
-    Redis-backed rate limiter using sliding window algorithm.
+    Redis-backed rate limiter using token bucket algorithm.
 
     Enforces per-vendor and per-tenant rate limits.
     """
@@ -29,32 +72,14 @@ class RateLimiter:
         Initialize rate limiter.
 
         Args:
-            redis_client: Redis client instance
+            redis_client: Redis client instance; defaults to the shared
+                process-wide client and its connection pool
             config_dir: Directory containing vendor configuration
         """
-        self.redis_client = redis_client
+        self._shared_client = redis_client is None
+        self.redis_client = redis_client if redis_client is not None else get_redis_client()
         self.config_dir = Path(config_dir)
-        self.vendor_configs: Dict[str, Any] = {}
-        self._load_vendor_configs()
-
-    def _load_vendor_configs(self) -> None:
-        """Load vendor configurations from YAML."""
-        vendor_config_file = self.config_dir / "vendor_config.yaml"
-        if vendor_config_file.exists():
-            with open(vendor_config_file, 'r') as f:
-                data = yaml.safe_load(f)
-                vendors = data.get('vendors', [])
-                self.vendor_configs = {v['name']: v for v in vendors}
-
-    async def _get_redis_client(self) -> redis.Redis:
-        """Get or create Redis client."""
-        if self.redis_client is None:
-            self.redis_client = redis.from_url(
-                settings.redis.url,
-                encoding="utf-8",
-                decode_responses=True
-            )
-        return self.redis_client
+        self.vendor_configs: Dict[str, Any] = load_vendor_configs(str(config_dir))
 
     def _get_rate_limit_key(self, vendor: str, tenant_id: UUID) -> str:
         """
@@ -67,7 +92,24 @@ class RateLimiter:
         Returns:
             Redis key
         """
-        return f"ratelimit:{vendor}:{tenant_id}"
+        return _bucket_key(vendor, tenant_id)
+
+    def _get_limit(self, vendor: str) -> int:
+        """
+        Get the per-minute request limit for a vendor.
+
+        The limit is also the bucket capacity, refilled at limit / 60 tokens
+        per second.
+
+        Args:
+            vendor: Vendor name
+
+        Returns:
+            Requests allowed per minute (default 100)
+        """
+        vendor_config = self.vendor_configs.get(vendor, {})
+        rate_limit_config = vendor_config.get('rate_limit', {})
+        return rate_limit_config.get('requests_per_minute', 100)
 
     async def check_rate_limit(
         self,
@@ -75,7 +117,7 @@ class RateLimiter:
         tenant_id: UUID
     ) -> RateLimitResult:
         """
-        Check if request is within rate limit.
+        Check if request is within rate limit without consuming a token.
 
         Args:
             vendor: Vendor name
@@ -84,50 +126,7 @@ class RateLimiter:
         Returns:
             Rate limit check result
         """
-        # Get vendor configuration
-        vendor_config = self.vendor_configs.get(vendor, {})
-        rate_limit_config = vendor_config.get('rate_limit', {})
-
-        # Default: 100 requests per minute
-        limit = rate_limit_config.get('requests_per_minute', 100)
-        window_seconds = 60
-
-        # Get current count from Redis
-        redis_client = await self._get_redis_client()
-        key = self._get_rate_limit_key(vendor, tenant_id)
-
-        try:
-            current_count = await redis_client.get(key)
-            current_count = int(current_count) if current_count else 0
-
-            # Check if limit exceeded
-            if current_count >= limit:
-                # Calculate retry_after based on TTL
-                ttl = await redis_client.ttl(key)
-                return RateLimitResult(
-                    allowed=False,
-                    remaining=0,
-                    retry_after=ttl if ttl > 0 else window_seconds,
-                    limit=limit
-                )
-
-            # Within limit
-            remaining = limit - current_count - 1
-            return RateLimitResult(
-                allowed=True,
-                remaining=max(0, remaining),
-                retry_after=None,
-                limit=limit
-            )
-
-        except Exception as e:
-            # If Redis fails, allow request (fail open)
-            return RateLimitResult(
-                allowed=True,
-                remaining=limit,
-                retry_after=None,
-                limit=limit
-            )
+        return await self._run_bucket(vendor, tenant_id, consume=False)
 
     async def consume_token(self, vendor: str, tenant_id: UUID) -> bool:
         """
@@ -140,26 +139,72 @@ class RateLimiter:
         Returns:
             True if token consumed, False if rate limit exceeded
         """
-        result = await self.check_rate_limit(vendor, tenant_id)
-        if not result.allowed:
-            return False
+        result = await self.acquire(vendor, tenant_id)
+        return result.allowed
+
+    async def acquire(self, vendor: str, tenant_id: UUID) -> RateLimitResult:
+        """
+        Check the rate limit and consume a token in a single Redis call.
+
+        Args:
+            vendor: Vendor name
+            tenant_id: Tenant ID
+
+        Returns:
+            Rate limit result; a token was consumed if allowed is True
+        """
+        return await self._run_bucket(vendor, tenant_id, consume=True)
+
+    async def _run_bucket(
+        self,
+        vendor: str,
+        tenant_id: UUID,
+        consume: bool
+    ) -> RateLimitResult:
+        """
+        Evaluate the vendor/tenant token bucket in Redis.
+
+        Args:
+            vendor: Vendor name
+            tenant_id: Tenant ID
+            consume: Whether to take a token if one is available
 
-        # Increment counter in Redis
-        redis_client = await self._get_redis_client()
+        Returns:
+            Rate limit result
+        """
+        limit = self._get_limit(vendor)
         key = self._get_rate_limit_key(vendor, tenant_id)
-        window_seconds = 60
 
         try:
-            # Use pipeline for atomicity
-            pipe = redis_client.pipeline()
-            pipe.incr(key)
-            pipe.expire(key, window_seconds)
-            await pipe.execute()
-            return True
+            allowed, remaining, retry_after = await _TOKEN_BUCKET(
+                keys=[key],
+                args=[limit, limit / 60, 1 if consume else 0],
+                client=self.redis_client
+            )
 
         except Exception:
             # If Redis fails, allow request (fail open)
-            return True
+            return RateLimitResult(
+                allowed=True,
+                remaining=limit,
+                retry_after=None,
+                limit=limit
+            )
+
+        if not allowed:
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                retry_after=max(1, retry_after),
+                limit=limit
+            )
+
+        return RateLimitResult(
+            allowed=True,
+            remaining=max(0, remaining),
+            retry_after=None,
+            limit=limit
+        )
 
     async def get_retry_after(self, vendor: str, tenant_id: UUID) -> Optional[int]:
         """
@@ -176,6 +221,10 @@ class RateLimiter:
         return result.retry_after
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self.redis_client:
+        """
+        Close an injected Redis client.
+
+        The shared client is left open; it is closed at shutdown by close_redis().
+        """
+        if not self._shared_client:
             await self.redis_client.close()
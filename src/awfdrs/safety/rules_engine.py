@@ -2,13 +2,34 @@
 Rules engine for error evaluation and retry policy determination.
 """
 
-import yaml
+import itertools
 import random
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+from src.awfdrs.safety.config_loader import load_yaml_section
 from src.awfdrs.safety.schemas import RuleEvaluation, BackoffCalculation, ErrorContext
 from src.awfdrs.core.enums import ErrorSeverity, ActionType
 
+# Pool of uniform jitter factors in [-1, 1), drawn once and cycled through;
+# backoff jitter only needs coarse spread, not a fresh random draw per retry
+_JITTER_POOL_SIZE = 4096
+_next_jitter = itertools.cycle(
+    tuple(2 * random.random() - 1 for _ in range(_JITTER_POOL_SIZE))
+).__next__
+
+
+class _CompiledRule(NamedTuple):
+    """Error definition and retry policy for one error code, resolved at load time."""
+
+    severity: ErrorSeverity
+    policy_name: str
+    retryable: bool
+    max_retries: int
+    initial_delay: float
+    max_delay: float
+    backoff_multiplier: float
+    base_delays: Tuple[float, ...]
+
 
 class RulesEngine:
     """
@@ -28,24 +49,49 @@ class RulesEngine:
         self.error_codes: Dict[str, Any] = {}
         self.retry_policies: Dict[str, Any] = {}
         self._load_configurations()
+        self._rules: Dict[str, _CompiledRule] = {
+            error_code: self._compile_rule(error_def)
+            for error_code, error_def in self.error_codes.items()
+        }
+        self._default_rule = self._compile_rule({})
 
     def _load_configurations(self) -> None:
-        """Load error codes and retry policies from YAML files."""
-        # Load error codes
-        error_codes_file = self.config_dir / "error_codes.yaml"
-        if error_codes_file.exists():
-            with open(error_codes_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self.error_codes = data.get('error_codes', {})
-
-        # Load retry policies
-        retry_policies_file = self.config_dir / "retry_policies.yaml"
-        if retry_policies_file.exists():
-            with open(retry_policies_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self.retry_policies = data.get('retry_policies', {})
-
-    async def evaluate_error(
+        """Load error codes and retry policies (parsed once per process and shared)."""
+        config_dir = str(self.config_dir)
+        self.error_codes = load_yaml_section(config_dir, "error_codes.yaml", "error_codes")
+        self.retry_policies = load_yaml_section(config_dir, "retry_policies.yaml", "retry_policies")
+
+    def _compile_rule(self, error_def: Dict[str, Any]) -> _CompiledRule:
+        """
+        Resolve an error definition and its retry policy, applying defaults.
+
+        Args:
+            error_def: Error definition from error_codes.yaml (empty for unknown codes)
+
+        Returns:
+            Compiled rule
+        """
+        policy_name = error_def.get('retry_policy', 'default')
+        policy = self.retry_policies.get(policy_name, {})
+        max_retries = policy.get('max_retries', 0)
+        initial_delay = policy.get('initial_delay_seconds', 1.0)
+        max_delay = policy.get('max_delay_seconds', 300.0)
+        backoff_multiplier = policy.get('backoff_multiplier', 2.0)
+        return _CompiledRule(
+            severity=ErrorSeverity(error_def.get('severity', 'medium')),
+            policy_name=policy_name,
+            retryable=policy.get('retryable', False),
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+            backoff_multiplier=backoff_multiplier,
+            base_delays=tuple(
+                min(initial_delay * (backoff_multiplier ** attempt), max_delay)
+                for attempt in range(max_retries + 1)
+            )
+        )
+
+    def evaluate_error(
         self,
         error_code: str,
         context: ErrorContext
@@ -60,26 +106,20 @@ class RulesEngine:
         Returns:
             Rule evaluation with recommended action
         """
-        # Get error definition
-        error_def = self.error_codes.get(error_code, {})
-        severity = ErrorSeverity(error_def.get('severity', 'medium'))
-        policy_name = error_def.get('retry_policy', 'default')
-
-        # Get retry policy
-        policy = self.retry_policies.get(policy_name, {})
-        retryable = policy.get('retryable', False)
-        max_retries = policy.get('max_retries', 0)
+        rule = self._rules.get(error_code, self._default_rule)
+        severity = rule.severity
+        policy_name = rule.policy_name
 
         # Determine if should retry
         should_retry = (
-            retryable and
-            context.retry_count < max_retries
+            rule.retryable and
+            context.retry_count < rule.max_retries
         )
 
         # Calculate backoff if retrying
         backoff = 0.0
         if should_retry:
-            backoff_calc = await self.calculate_backoff(error_code, context.retry_count)
+            backoff_calc = self.calculate_backoff(error_code, context.retry_count)
             backoff = backoff_calc.total_delay
 
         # Determine recommended action
@@ -99,7 +139,7 @@ class RulesEngine:
             reasoning=f"Error code '{error_code}' evaluated with policy '{policy_name}'"
         )
 
-    async def should_retry(self, error_code: str, retry_count: int) -> bool:
+    def should_retry(self, error_code: str, retry_count: int) -> bool:
         """
         Determine if an error should be retried.
 
@@ -110,16 +150,10 @@ class RulesEngine:
         Returns:
             True if should retry, False otherwise
         """
-        error_def = self.error_codes.get(error_code, {})
-        policy_name = error_def.get('retry_policy', 'default')
-        policy = self.retry_policies.get(policy_name, {})
-
-        retryable = policy.get('retryable', False)
-        max_retries = policy.get('max_retries', 0)
+        rule = self._rules.get(error_code, self._default_rule)
+        return rule.retryable and retry_count < rule.max_retries
 
-        return retryable and retry_count < max_retries
-
-    async def calculate_backoff(
+    def calculate_backoff(
         self,
         error_code: str,
         retry_count: int
@@ -134,23 +168,19 @@ class RulesEngine:
         Returns:
             Backoff calculation with delays
         """
-        error_def = self.error_codes.get(error_code, {})
-        policy_name = error_def.get('retry_policy', 'default')
-        policy = self.retry_policies.get(policy_name, {})
+        rule = self._rules.get(error_code, self._default_rule)
 
-        # Get backoff configuration
-        initial_delay = policy.get('initial_delay_seconds', 1.0)
-        max_delay = policy.get('max_delay_seconds', 300.0)
-        backoff_multiplier = policy.get('backoff_multiplier', 2.0)
-
-        # Calculate exponential backoff
-        base_delay = min(
-            initial_delay * (backoff_multiplier ** retry_count),
-            max_delay
-        )
+        # Exponential backoff, precomputed for every retry the policy allows
+        if retry_count < len(rule.base_delays):
+            base_delay = rule.base_delays[retry_count]
+        else:
+            base_delay = min(
+                rule.initial_delay * (rule.backoff_multiplier ** retry_count),
+                rule.max_delay
+            )
 
         # Add jitter (±20% of base delay)
-        jitter = base_delay * 0.2 * (2 * random.random() - 1)
+        jitter = base_delay * 0.2 * _next_jitter()
         total_delay = max(0, base_delay + jitter)
 
         return BackoffCalculation(
@@ -160,7 +190,7 @@ class RulesEngine:
             retry_count=retry_count
         )
 
-    async def get_error_severity(self, error_code: str) -> ErrorSeverity:
+    def get_error_severity(self, error_code: str) -> ErrorSeverity:
         """
         Get severity level for an error code.
 
@@ -170,6 +200,4 @@ class RulesEngine:
         Returns:
             Error severity
         """
-        error_def = self.error_codes.get(error_code, {})
-        severity_str = error_def.get('severity', 'medium')
-        return ErrorSeverity(severity_str)
+        return self._rules.get(error_code, self._default_rule).severity
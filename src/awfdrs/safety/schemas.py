@@ -2,7 +2,7 @@
 Pydantic schemas for safety layer.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from pydantic import BaseModel, Field
 from src.awfdrs.core.enums import ErrorSeverity, ActionType
 
@@ -38,10 +38,15 @@ class BackoffCalculation(BaseModel):
     retry_count: int
 
 
-class RateLimitResult(BaseModel):
-    """Result of rate limit check."""
+class RateLimitResult(NamedTuple):
+    """
+    Result of rate limit check.
+
+    A NamedTuple rather than a model: it is built on every rate-limited call
+    and only ever read internally, so it skips pydantic validation.
+    """
 
     allowed: bool
     remaining: int
-    retry_after: Optional[int] = None
     limit: int
+    retry_after: Optional[int] = None
@@ -1,7 +1,12 @@
 """
 Sample event data for testing.
+
+Each builder shallow-copies a module-level template and fills in only the
+per-call fields (idempotency key and timestamp). Payloads are copied as well,
+so tests may mutate the returned event freely.
 """
 
+import time
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -14,26 +19,159 @@ TENANT_GLOBAL = UUID("00000000-0000-0000-0000-000000000002")
 WORKFLOW_PAYMENT = UUID("10000000-0000-0000-0000-000000000001")
 WORKFLOW_ONBOARDING = UUID("10000000-0000-0000-0000-000000000002")
 WORKFLOW_COMPLIANCE = UUID("10000000-0000-0000-0000-000000000003")
+WORKFLOW_KILL_SWITCHED = UUID("10000000-0000-0000-0000-000000000004")
+
+# String forms, formatted once for use in request bodies
+TENANT_ACME_S = str(TENANT_ACME)
+TENANT_GLOBAL_S = str(TENANT_GLOBAL)
+WORKFLOW_PAYMENT_S = str(WORKFLOW_PAYMENT)
+WORKFLOW_ONBOARDING_S = str(WORKFLOW_ONBOARDING)
+WORKFLOW_COMPLIANCE_S = str(WORKFLOW_COMPLIANCE)
+WORKFLOW_KILL_SWITCHED_S = str(WORKFLOW_KILL_SWITCHED)
+
+# Reuse one timestamp for builders called within this many seconds
+_NOW_ISO_RESOLUTION = 0.001
+
+_now_iso_value = ""
+_now_iso_at = float("-inf")
+
+
+def _now_iso() -> str:
+    """Return datetime.utcnow().isoformat(), refreshed at most once per millisecond."""
+    global _now_iso_value, _now_iso_at
+    now = time.monotonic()
+    if now - _now_iso_at > _NOW_ISO_RESOLUTION:
+        _now_iso_value = datetime.utcnow().isoformat()
+        _now_iso_at = now
+    return _now_iso_value
+
+
+def _build(template: dict, idempotency_key: str) -> dict:
+    """Copy a template and fill in the per-call fields."""
+    event = template.copy()
+    event["payload"] = template["payload"].copy()
+    event["idempotency_key"] = idempotency_key
+    event["occurred_at"] = _now_iso()
+    return event
+
+
+_PAYMENT_SUCCESS_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "payment.completed",
+    "payload": {
+        "payment_id": "pay_12345",
+        "amount": 100.00,
+        "currency": "USD",
+        "status": "succeeded",
+        "payment_method": "card",
+        "customer_id": "cust_67890"
+    },
+    "schema_version": "1.0.0"
+}
+
+_PAYMENT_FAILED_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "payment.failed",
+    "payload": {
+        "payment_id": "pay_12346",
+        "amount": 100.00,
+        "currency": "USD",
+        "status": "failed",
+        "error_code": "card_declined",
+        "error_message": "Payment processing failed",
+        "payment_method": "card",
+        "customer_id": "cust_67890",
+        "retry_count": 0
+    },
+    "schema_version": "1.0.0"
+}
+
+_ONBOARDING_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_ONBOARDING_S,
+    "event_type": "user.onboarding.started",
+    "payload": {
+        "user_id": "user_11111",
+        "email": "test@example.com",
+        "step": "email_verification",
+        "status": "in_progress"
+    },
+    "schema_version": "1.0.0"
+}
+
+_API_CALL_FAILED_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "api_call.failed",
+    "payload": {
+        "vendor": "stripe",
+        "endpoint": "/v1/payment_intents",
+        "method": "POST",
+        "status_code": 500,
+        "error_code": "internal_server_error",
+        "error_message": "The server encountered an internal error",
+        "request_id": "req_xyz123",
+        "retry_count": 0
+    },
+    "schema_version": "1.0.0"
+}
+
+_TIMEOUT_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "api_call.failed",
+    "payload": {
+        "vendor": "plaid",
+        "endpoint": "/accounts/balance/get",
+        "method": "POST",
+        "error_code": "timeout",
+        "error_message": "Request timed out after 30 seconds",
+        "timeout_duration": 30,
+        "retry_count": 1
+    },
+    "schema_version": "1.0.0"
+}
+
+_RATE_LIMIT_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "api_call.failed",
+    "payload": {
+        "vendor": "twilio",
+        "endpoint": "/Messages.json",
+        "method": "POST",
+        "status_code": 429,
+        "error_code": "rate_limit_exceeded",
+        "error_message": "Too many requests",
+        "retry_after": 60,
+        "retry_count": 0
+    },
+    "schema_version": "1.0.0"
+}
+
+_COMPLIANCE_CHECK_TEMPLATE = {
+    "tenant_id": TENANT_GLOBAL_S,
+    "workflow_id": WORKFLOW_COMPLIANCE_S,
+    "event_type": "compliance.check.completed",
+    "payload": {
+        "check_id": "check_22222",
+        "user_id": "user_33333",
+        "check_type": "kyc_verification",
+        "status": "passed",
+        "risk_score": 25
+    },
+    "schema_version": "1.0.0"
+}
 
 
 def sample_payment_success_event(idempotency_key: str = None) -> dict:
     """Generate a sample successful payment event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "payment.completed",
-        "payload": {
-            "payment_id": "pay_12345",
-            "amount": 100.00,
-            "currency": "USD",
-            "status": "succeeded",
-            "payment_method": "card",
-            "customer_id": "cust_67890"
-        },
-        "idempotency_key": idempotency_key or f"test-payment-success-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    return _build(
+        _PAYMENT_SUCCESS_TEMPLATE,
+        idempotency_key or f"test-payment-success-{uuid4()}"
+    )
 
 
 def sample_payment_failed_event(
@@ -41,43 +179,20 @@ def sample_payment_failed_event(
     error_code: str = "card_declined"
 ) -> dict:
     """Generate a sample failed payment event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "payment.failed",
-        "payload": {
-            "payment_id": "pay_12346",
-            "amount": 100.00,
-            "currency": "USD",
-            "status": "failed",
-            "error_code": error_code,
-            "error_message": "Payment processing failed",
-            "payment_method": "card",
-            "customer_id": "cust_67890",
-            "retry_count": 0
-        },
-        "idempotency_key": idempotency_key or f"test-payment-failed-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    event = _build(
+        _PAYMENT_FAILED_TEMPLATE,
+        idempotency_key or f"test-payment-failed-{uuid4()}"
+    )
+    event["payload"]["error_code"] = error_code
+    return event
 
 
 def sample_onboarding_event(idempotency_key: str = None) -> dict:
     """Generate a sample user onboarding event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_ONBOARDING),
-        "event_type": "user.onboarding.started",
-        "payload": {
-            "user_id": "user_11111",
-            "email": "test@example.com",
-            "step": "email_verification",
-            "status": "in_progress"
-        },
-        "idempotency_key": idempotency_key or f"test-onboarding-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    return _build(
+        _ONBOARDING_TEMPLATE,
+        idempotency_key or f"test-onboarding-{uuid4()}"
+    )
 
 
 def sample_api_call_failed_event(
@@ -85,86 +200,36 @@ def sample_api_call_failed_event(
     vendor: str = "stripe"
 ) -> dict:
     """Generate a sample API call failure event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "api_call.failed",
-        "payload": {
-            "vendor": vendor,
-            "endpoint": "/v1/payment_intents",
-            "method": "POST",
-            "status_code": 500,
-            "error_code": "internal_server_error",
-            "error_message": "The server encountered an internal error",
-            "request_id": "req_xyz123",
-            "retry_count": 0
-        },
-        "idempotency_key": idempotency_key or f"test-api-failed-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    event = _build(
+        _API_CALL_FAILED_TEMPLATE,
+        idempotency_key or f"test-api-failed-{uuid4()}"
+    )
+    event["payload"]["vendor"] = vendor
+    return event
 
 
 def sample_timeout_event(idempotency_key: str = None) -> dict:
     """Generate a sample timeout event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "api_call.failed",
-        "payload": {
-            "vendor": "plaid",
-            "endpoint": "/accounts/balance/get",
-            "method": "POST",
-            "error_code": "timeout",
-            "error_message": "Request timed out after 30 seconds",
-            "timeout_duration": 30,
-            "retry_count": 1
-        },
-        "idempotency_key": idempotency_key or f"test-timeout-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    return _build(
+        _TIMEOUT_TEMPLATE,
+        idempotency_key or f"test-timeout-{uuid4()}"
+    )
 
 
 def sample_rate_limit_event(idempotency_key: str = None) -> dict:
     """Generate a sample rate limit event."""
-    return {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "api_call.failed",
-        "payload": {
-            "vendor": "twilio",
-            "endpoint": "/Messages.json",
-            "method": "POST",
-            "status_code": 429,
-            "error_code": "rate_limit_exceeded",
-            "error_message": "Too many requests",
-            "retry_after": 60,
-            "retry_count": 0
-        },
-        "idempotency_key": idempotency_key or f"test-rate-limit-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    return _build(
+        _RATE_LIMIT_TEMPLATE,
+        idempotency_key or f"test-rate-limit-{uuid4()}"
+    )
 
 
 def sample_compliance_check_event(idempotency_key: str = None) -> dict:
     """Generate a sample compliance check event."""
-    return {
-        "tenant_id": str(TENANT_GLOBAL),
-        "workflow_id": str(WORKFLOW_COMPLIANCE),
-        "event_type": "compliance.check.completed",
-        "payload": {
-            "check_id": "check_22222",
-            "user_id": "user_33333",
-            "check_type": "kyc_verification",
-            "status": "passed",
-            "risk_score": 25
-        },
-        "idempotency_key": idempotency_key or f"test-compliance-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    return _build(
+        _COMPLIANCE_CHECK_TEMPLATE,
+        idempotency_key or f"test-compliance-{uuid4()}"
+    )
 
 
 # Collection of all sample events
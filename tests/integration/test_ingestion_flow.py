@@ -2,175 +2,276 @@
 Integration tests for event ingestion flow.
 """
 
-import pytest
-from httpx import AsyncClient
-from datetime import datetime
-from uuid import uuid4
+import asyncio
+import itertools
 
-from src.awfdrs.db.models.tenants import Tenant
-from src.awfdrs.db.models.workflows import Workflow
-from tests.fixtures.events import TENANT_ACME, WORKFLOW_PAYMENT
+import pytest
+from httpx import ASGITransport, AsyncClient
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.awfdrs.core.exceptions import ConflictError
+from src.awfdrs.db.models.events import Event
+from src.awfdrs.db.repositories.events import EventRepository
+from src.awfdrs.dependencies import get_lookup_cache
+from src.awfdrs.ingestion.schemas import WorkflowEventV1
+from src.awfdrs.ingestion.service import _BufferedFlusher
+from src.awfdrs.main import app
+from tests.fixtures.events import (
+    TENANT_ACME,
+    TENANT_ACME_S,
+    WORKFLOW_KILL_SWITCHED_S,
+    WORKFLOW_PAYMENT_S
+)
+
+# Every test event shares one timestamp and body; tests override single fields
+OCCURRED_AT_ISO = datetime.now(timezone.utc).isoformat()
+
+EVENT_TEMPLATE = {
+    "tenant_id": TENANT_ACME_S,
+    "workflow_id": WORKFLOW_PAYMENT_S,
+    "event_type": "payment.completed",
+    "payload": {
+        "amount": 100.00,
+        "currency": "USD"
+    },
+    "occurred_at": OCCURRED_AT_ISO,
+    "schema_version": "1.0.0"
+}
+
+# Test rows are rolled back after each test, so keys only need to be unique
+# within a run; deterministic keys also make failures easy to trace
+_KEY_COUNTER = itertools.count()
+
+
+def _idempotency_key(request: pytest.FixtureRequest) -> str:
+    """Build an idempotency key unique within this test run."""
+    return f"test-{request.node.name}-{next(_KEY_COUNTER)}"
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ingest_valid_event(client: AsyncClient, db_session):
-    """Test ingesting a valid event."""
-    # Setup: Create tenant and workflow
-    tenant = Tenant(
-        id=TENANT_ACME,
-        name="Test Tenant",
-        is_active=True
-    )
-    db_session.add(tenant)
-
-    workflow = Workflow(
-        id=WORKFLOW_PAYMENT,
-        tenant_id=TENANT_ACME,
-        name="test_workflow",
-        is_kill_switched=False
-    )
-    db_session.add(workflow)
-    await db_session.commit()
-
-    # Test: Submit event
-    event_data = {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "payment.completed",
-        "payload": {
-            "amount": 100.00,
-            "currency": "USD"
-        },
-        "idempotency_key": f"test-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+@pytest.mark.usefixtures("seeded_tenant_workflow")
+@pytest.mark.parametrize(
+    ("overrides", "submissions", "expected_status"),
+    [
+        pytest.param({}, 1, 201, id="valid_event"),
+        pytest.param({}, 2, 409, id="duplicate_idempotency_key"),
+        pytest.param(
+            {"tenant_id": str(uuid4()), "workflow_id": str(uuid4())},
+            1,
+            404,
+            id="invalid_tenant"
+        ),
+        pytest.param(
+            {"workflow_id": WORKFLOW_KILL_SWITCHED_S},
+            1,
+            403,
+            id="kill_switched_workflow"
+        ),
+        pytest.param({"schema_version": "99.0.0"}, 1, 422, id="invalid_schema_version"),
+    ]
+)
+async def test_ingest_event(
+    request: pytest.FixtureRequest,
+    client: AsyncClient,
+    db_session,
+    overrides: dict,
+    submissions: int,
+    expected_status: int
+):
+    """Test the status returned for a single event, resubmitting it for duplicates."""
+    event_data = {**EVENT_TEMPLATE, "idempotency_key": _idempotency_key(request), **overrides}
+
+    # Earlier submissions of the same event must be accepted
+    for _ in range(submissions - 1):
+        response = await client.post("/api/v1/events", json=event_data)
+        assert response.status_code == 201
 
     response = await client.post("/api/v1/events", json=event_data)
 
-    # Assert
-    assert response.status_code == 201
+    assert response.status_code == expected_status
+    if expected_status == 201:
+        data = response.json()
+        assert data["status"] == "accepted"
+        assert "event_id" in data
+        assert "correlation_id" in data
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("seeded_tenant_workflow")
+async def test_ingest_batch_reports_per_event_results(
+    request: pytest.FixtureRequest,
+    client: AsyncClient,
+    db_session
+):
+    """Test that a batch stores valid events and reports the rejected ones."""
+    def make_event(idempotency_key: str, tenant_id=TENANT_ACME) -> dict:
+        return {
+            **EVENT_TEMPLATE,
+            "tenant_id": str(tenant_id),
+            "idempotency_key": idempotency_key
+        }
+
+    repeated_key = _idempotency_key(request)
+    batch = [
+        make_event(_idempotency_key(request)),
+        make_event(repeated_key),
+        make_event(repeated_key),  # Duplicate within the batch
+        make_event(_idempotency_key(request), tenant_id=uuid4()),  # Unknown tenant
+    ]
+
+    response = await client.post("/api/v1/events/batch", json=batch)
+
+    assert response.status_code == 200
     data = response.json()
-    assert data["status"] == "accepted"
-    assert "event_id" in data
-    assert "correlation_id" in data
+    assert data["processed"] == 2
+    assert data["failed"] == 2
+    assert len(data["event_ids"]) == 2
+    assert {(e["index"], e["status_code"]) for e in data["errors"]} == {(2, 409), (3, 404)}
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ingest_duplicate_idempotency_key(client: AsyncClient, db_session):
-    """Test that duplicate idempotency key returns 409."""
-    # Setup
-    tenant = Tenant(id=TENANT_ACME, name="Test Tenant", is_active=True)
-    db_session.add(tenant)
-
-    workflow = Workflow(
-        id=WORKFLOW_PAYMENT,
-        tenant_id=TENANT_ACME,
-        name="test_workflow",
-        is_kill_switched=False
+@pytest.mark.usefixtures("seeded_tenant_workflow")
+async def test_ingest_batch_isolates_concurrently_stored_key(
+    request: pytest.FixtureRequest,
+    client: AsyncClient,
+    db_session,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a key stored after the duplicate lookup rejects only its own event."""
+    stored_key = _idempotency_key(request)
+    response = await client.post(
+        "/api/v1/events", json={**EVENT_TEMPLATE, "idempotency_key": stored_key}
     )
-    db_session.add(workflow)
-    await db_session.commit()
+    assert response.status_code == 201
 
-    idempotency_key = f"test-duplicate-{uuid4()}"
+    # Simulate a concurrent writer committing between the lookup and the insert
+    async def no_existing_keys(self, keys):
+        return set()
 
-    event_data = {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "payment.completed",
-        "payload": {"amount": 100.00},
-        "idempotency_key": idempotency_key,
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    monkeypatch.setattr(
+        EventRepository, "get_existing_idempotency_keys", no_existing_keys
+    )
+    batch = [
+        {**EVENT_TEMPLATE, "idempotency_key": _idempotency_key(request)},
+        {**EVENT_TEMPLATE, "idempotency_key": stored_key},
+        {**EVENT_TEMPLATE, "idempotency_key": _idempotency_key(request)},
+    ]
 
-    # First submission should succeed
-    response1 = await client.post("/api/v1/events", json=event_data)
-    assert response1.status_code == 201
+    response = await client.post("/api/v1/events/batch", json=batch)
 
-    # Second submission with same idempotency key should fail
-    response2 = await client.post("/api/v1/events", json=event_data)
-    assert response2.status_code == 409
+    assert response.status_code == 200
+    data = response.json()
+    assert data["processed"] == 2
+    assert len(data["event_ids"]) == 2
+    assert [(e["index"], e["status_code"]) for e in data["errors"]] == [(1, 409)]
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ingest_invalid_tenant(client: AsyncClient, db_session):
-    """Test that invalid tenant returns 404."""
-    event_data = {
-        "tenant_id": str(uuid4()),  # Non-existent tenant
-        "workflow_id": str(uuid4()),
-        "event_type": "test.event",
-        "payload": {"test": "data"},
-        "idempotency_key": f"test-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+@pytest.mark.usefixtures("seeded_tenant_workflow")
+async def test_buffered_flush_isolates_conflicting_key(
+    request: pytest.FixtureRequest,
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that one conflicting key in a buffered flush does not reject the others."""
+    stored_key = _idempotency_key(request)
+    response = await client.post(
+        "/api/v1/events", json={**EVENT_TEMPLATE, "idempotency_key": stored_key}
+    )
+    assert response.status_code == 201
 
-    response = await client.post("/api/v1/events", json=event_data)
-    assert response.status_code == 404
+    # Flushes run in the test's transaction, and the stored key slips past
+    # the duplicate lookup as if a concurrent writer had just committed it
+    connection = await db_session.connection()
+    monkeypatch.setattr(
+        "src.awfdrs.ingestion.service.AsyncSessionLocal",
+        lambda: AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+    )
+
+    async def no_existing_keys(self, keys):
+        return set()
+
+    monkeypatch.setattr(
+        EventRepository, "get_existing_idempotency_keys", no_existing_keys
+    )
+    keys = [_idempotency_key(request), stored_key, _idempotency_key(request)]
+    flusher = _BufferedFlusher()
+    flusher.start(batch_size=10, batch_ms=50)
+
+    results = await asyncio.gather(
+        *(
+            flusher.submit(
+                WorkflowEventV1(**{**EVENT_TEMPLATE, "idempotency_key": key}), "corr-1"
+            )
+            for key in keys
+        ),
+        return_exceptions=True
+    )
+    await flusher.stop()
+
+    assert isinstance(results[0], UUID)
+    assert isinstance(results[1], ConflictError)
+    assert isinstance(results[2], UUID)
+    stored = await db_session.scalars(
+        select(Event.id).where(Event.idempotency_key.in_([keys[0], keys[2]]))
+    )
+    assert set(stored.all()) == {results[0], results[2]}
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ingest_kill_switched_workflow(client: AsyncClient, db_session):
-    """Test that kill-switched workflow returns 403."""
-    # Setup
-    tenant = Tenant(id=TENANT_ACME, name="Test Tenant", is_active=True)
-    db_session.add(tenant)
-
-    workflow = Workflow(
-        id=WORKFLOW_PAYMENT,
-        tenant_id=TENANT_ACME,
-        name="test_workflow",
-        is_kill_switched=True  # Kill switch active
+@pytest.mark.usefixtures("seeded_tenant_workflow")
+async def test_ingest_event_reports_failed_commit(
+    request: pytest.FixtureRequest,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a commit failing after the handler returns yields 500, not 201."""
+    connection = await db_session.connection()
+
+    class FailingCommitSession(AsyncSession):
+        async def commit(self) -> None:
+            raise RuntimeError("commit failed")
+
+    # Exercise the real get_db, with its session on the test's transaction
+    monkeypatch.setattr(
+        "src.awfdrs.db.session.AsyncSessionLocal",
+        lambda: FailingCommitSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
     )
-    db_session.add(workflow)
-    await db_session.commit()
-
-    event_data = {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "test.event",
-        "payload": {"test": "data"},
-        "idempotency_key": f"test-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "1.0.0"
-    }
+    monkeypatch.setitem(app.dependency_overrides, get_lookup_cache, lambda: None)
+    event_data = {**EVENT_TEMPLATE, "idempotency_key": _idempotency_key(request)}
 
-    response = await client.post("/api/v1/events", json=event_data)
-    assert response.status_code == 403
+    # The generic exception handler's 500 is what a real client receives
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/v1/events", json=event_data)
+
+    assert response.status_code == 500
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ingest_invalid_schema_version(client: AsyncClient, db_session):
-    """Test that invalid schema version returns 422."""
-    tenant = Tenant(id=TENANT_ACME, name="Test Tenant", is_active=True)
-    db_session.add(tenant)
-
-    workflow = Workflow(
-        id=WORKFLOW_PAYMENT,
-        tenant_id=TENANT_ACME,
-        name="test_workflow",
-        is_kill_switched=False
-    )
-    db_session.add(workflow)
-    await db_session.commit()
-
-    event_data = {
-        "tenant_id": str(TENANT_ACME),
-        "workflow_id": str(WORKFLOW_PAYMENT),
-        "event_type": "test.event",
-        "payload": {"test": "data"},
-        "idempotency_key": f"test-{uuid4()}",
-        "occurred_at": datetime.utcnow().isoformat(),
-        "schema_version": "99.0.0"  # Invalid version
-    }
+async def test_ingest_batch_rejects_oversized_batch(client: AsyncClient):
+    """Test that batches over the size limit return 422."""
+    event = {**EVENT_TEMPLATE, "idempotency_key": "test-oversized"}
 
-    response = await client.post("/api/v1/events", json=event_data)
+    response = await client.post("/api/v1/events/batch", json=[event] * 101)
     assert response.status_code == 422
 
 
@@ -6,9 +6,89 @@ Returns deterministic responses without making real API calls.
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 import json
+import re
+
+
+# Canned responses are static, so they are serialized once at import time
+
+# Mock error analysis
+ERROR_ANALYSIS_JSON = json.dumps({
+    "error_type": "payment_processing_error",
+    "severity": "high",
+    "confidence": 0.85,
+    "hypothesis": "Payment gateway timeout due to network congestion",
+    "suggested_action": "retry",
+    "reasoning": "Similar pattern observed in historical incidents"
+})
+
+# Mock root cause analysis
+ROOT_CAUSE_JSON = json.dumps({
+    "root_cause": "Database connection pool exhaustion",
+    "confidence": 0.78,
+    "contributing_factors": [
+        "High concurrent user load",
+        "Inefficient query patterns",
+        "Insufficient connection pool size"
+    ],
+    "recommendations": [
+        "Increase connection pool size",
+        "Optimize database queries",
+        "Implement connection pooling monitoring"
+    ]
+})
+
+# Mock similarity analysis
+SIMILARITY_JSON = json.dumps({
+    "is_similar": True,
+    "confidence": 0.82,
+    "similar_incidents": [
+        "incident-001",
+        "incident-042"
+    ],
+    "common_patterns": [
+        "Same error code",
+        "Same vendor",
+        "Similar time of day"
+    ]
+})
+
+# Default mock response
+DEFAULT_JSON = json.dumps({
+    "status": "analyzed",
+    "confidence": 0.75,
+    "message": "Mock AI analysis completed"
+})
+
+# Keyword groups in priority order: error analysis, root cause, similarity.
+# The lookahead makes matches zero-width, so overlapping keywords are all seen.
+_RESPONSE_PATTERN = re.compile(
+    r"(?=(error|failure)|(root cause|rca)|(similar))",
+    re.IGNORECASE
+)
+_RESPONSES_BY_GROUP = (ERROR_ANALYSIS_JSON, ROOT_CAUSE_JSON, SIMILARITY_JSON)
+
+
+def _select_response(message: str) -> str:
+    """
+    Pick the canned response for a prompt in a single pass over it.
+
+    Args:
+        message: Last user message
+
+    Returns:
+        Serialized response for the highest-priority keyword found
+    """
+    best = None
+    for match in _RESPONSE_PATTERN.finditer(message):
+        group = match.lastindex - 1
+        if group == 0:
+            return ERROR_ANALYSIS_JSON
+        if best is None or group < best:
+            best = group
+    return DEFAULT_JSON if best is None else _RESPONSES_BY_GROUP[best]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockChoice:
     """Mock choice object."""
 
@@ -17,7 +97,7 @@ class MockChoice:
     finish_reason: str = "stop"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockChatCompletion:
     """Mock chat completion response."""
 
@@ -47,14 +127,7 @@ class MockChatCompletions:
         last_message = user_messages[-1]["content"] if user_messages else ""
 
         # Determine response based on content
-        if "error" in last_message.lower() or "failure" in last_message.lower():
-            response_content = self._error_analysis_response()
-        elif "root cause" in last_message.lower() or "rca" in last_message.lower():
-            response_content = self._root_cause_response()
-        elif "similar" in last_message.lower():
-            response_content = self._similarity_response()
-        else:
-            response_content = self._default_response()
+        response_content = _select_response(last_message)
 
         return MockChatCompletion(
             id="mock-completion-id",
@@ -62,64 +135,12 @@ class MockChatCompletions:
                 MockChoice(
                     message={
                         "role": "assistant",
-                        "content": json.dumps(response_content)
+                        "content": response_content
                     }
                 )
             ]
         )
 
-    def _error_analysis_response(self) -> Dict[str, Any]:
-        """Return mock error analysis."""
-        return {
-            "error_type": "payment_processing_error",
-            "severity": "high",
-            "confidence": 0.85,
-            "hypothesis": "Payment gateway timeout due to network congestion",
-            "suggested_action": "retry",
-            "reasoning": "Similar pattern observed in historical incidents"
-        }
-
-    def _root_cause_response(self) -> Dict[str, Any]:
-        """Return mock root cause analysis."""
-        return {
-            "root_cause": "Database connection pool exhaustion",
-            "confidence": 0.78,
-            "contributing_factors": [
-                "High concurrent user load",
-                "Inefficient query patterns",
-                "Insufficient connection pool size"
-            ],
-            "recommendations": [
-                "Increase connection pool size",
-                "Optimize database queries",
-                "Implement connection pooling monitoring"
-            ]
-        }
-
-    def _similarity_response(self) -> Dict[str, Any]:
-        """Return mock similarity analysis."""
-        return {
-            "is_similar": True,
-            "confidence": 0.82,
-            "similar_incidents": [
-                "incident-001",
-                "incident-042"
-            ],
-            "common_patterns": [
-                "Same error code",
-                "Same vendor",
-                "Similar time of day"
-            ]
-        }
-
-    def _default_response(self) -> Dict[str, Any]:
-        """Return default mock response."""
-        return {
-            "status": "analyzed",
-            "confidence": 0.75,
-            "message": "Mock AI analysis completed"
-        }
-
 
 class MockChat:
     """Mock chat API."""
@@ -3,38 +3,103 @@ Mock Pinecone vector database client for testing.
 Returns deterministic similarity search results without making real API calls.
 """
 
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from collections import defaultdict
+from itertools import islice
+import functools
 import random
 
 
-@dataclass
-class MockMatch:
-    """Mock vector similarity match."""
+# Metadata of the default matches returned by an empty index; even and odd
+# ranked matches differ only in their resolution
+_DEFAULT_MATCH_METADATA = tuple(
+    {
+        "error_code": "PAYMENT_FAILED",
+        "vendor": "stripe",
+        "timestamp": "2026-01-19T10:00:00Z",
+        "resolution": resolution
+    }
+    for resolution in ("retry_successful", "escalated")
+)
 
-    id: str
-    score: float
-    metadata: Dict[str, Any]
 
-
-@dataclass
-class MockQueryResponse:
-    """Mock query response."""
-
-    matches: List[MockMatch]
-    namespace: str = ""
+@functools.lru_cache(maxsize=256)
+def _mock_scores(start: float, step: float, count: int) -> Tuple[float, ...]:
+    """Decreasing mock similarity scores, computed once per result size."""
+    return tuple(start - (i * step) for i in range(count))
 
 
 class MockPineconeIndex:
     """
     Mock Pinecone index that simulates vector similarity search.
     Stores vectors in memory and returns mock similarity results.
+
+    Vectors are kept per namespace, and metadata equality filters are
+    answered from an inverted index of (namespace, key, value) to vector IDs,
+    so queries never scan other namespaces or non-matching vectors.
     """
 
     def __init__(self, name: str) -> None:
         """Initialize mock index."""
         self.name = name
-        self._vectors: Dict[str, Dict[str, Any]] = {}
+        # namespace -> vector ID -> {"values": ..., "metadata": ...}
+        self._namespaces: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        # (namespace, metadata key, value) -> vector IDs in insertion order
+        self._filter_index: Dict[Tuple[str, str, Any], Dict[str, None]] = defaultdict(dict)
+
+    def _index_metadata(self, namespace: str, vector_id: str, metadata: Dict[str, Any]) -> None:
+        """Add a vector's metadata values to the filter index."""
+        for key, value in metadata.items():
+            try:
+                self._filter_index[(namespace, key, value)][vector_id] = None
+            except TypeError:
+                # Unhashable values (lists, dicts) can never equal a filter value
+                continue
+
+    def _unindex_metadata(self, namespace: str, vector_id: str, metadata: Dict[str, Any]) -> None:
+        """Remove a vector's metadata values from the filter index."""
+        for key, value in metadata.items():
+            try:
+                posting = self._filter_index.get((namespace, key, value))
+            except TypeError:
+                continue
+            if posting is not None:
+                posting.pop(vector_id, None)
+                if not posting:
+                    del self._filter_index[(namespace, key, value)]
+
+    def _filter_ids(self, namespace: str, filter: Dict[str, Any]) -> Iterator[str]:
+        """
+        Lazily find the IDs of vectors whose metadata matches every filter value.
+
+        Args:
+            namespace: Namespace to search
+            filter: Metadata key/value pairs that must all match
+
+        Yields:
+            Matching vector IDs in insertion order
+        """
+        postings = []
+        for key, value in filter.items():
+            try:
+                posting = self._filter_index.get((namespace, key, value))
+            except TypeError:
+                # Unhashable filter values are not indexed; fall back to a scan
+                yield from (
+                    vector_id
+                    for vector_id, vector_data in self._namespaces.get(namespace, {}).items()
+                    if all(vector_data["metadata"].get(k) == v for k, v in filter.items())
+                )
+                return
+            if not posting:
+                return
+            postings.append(posting)
+
+        smallest = min(postings, key=len)
+        yield from (
+            vector_id for vector_id in smallest
+            if all(vector_id in posting for posting in postings)
+        )
 
     def upsert(
         self,
@@ -63,11 +128,16 @@ class MockPineconeIndex:
                 vector_values = vector_data[1] if len(vector_data) > 1 else []
                 metadata = vector_data[2] if len(vector_data) > 2 else {}
 
-            self._vectors[vector_id] = {
+            stored = self._namespaces[namespace]
+            previous = stored.get(vector_id)
+            if previous is not None:
+                self._unindex_metadata(namespace, vector_id, previous["metadata"])
+
+            stored[vector_id] = {
                 "values": vector_values,
-                "metadata": metadata,
-                "namespace": namespace
+                "metadata": metadata
             }
+            self._index_metadata(namespace, vector_id, metadata)
 
         return {"upserted_count": len(vectors)}
 
@@ -98,28 +168,25 @@ class MockPineconeIndex:
         """
         # Generate mock matches with decreasing similarity scores
         matches = []
+        vectors = self._namespaces.get(namespace)
 
-        if not self._vectors:
+        if not vectors:
             # Return default mock matches if no vectors stored
-            mock_matches = self._get_default_matches(top_k)
-            matches = [{"id": m.id, "score": m.score, "metadata": m.metadata} for m in mock_matches]
+            matches = list(self._default_matches(top_k))
         else:
-            # Return matches from stored vectors
-            stored_ids = list(self._vectors.keys())
-            for i in range(min(top_k, len(stored_ids))):
-                vector_id = stored_ids[i]
-                vector_data = self._vectors[vector_id]
-
-                # Apply filter if provided
-                if filter:
-                    metadata = vector_data.get("metadata", {})
-                    # Simple filter check
-                    if not all(metadata.get(k) == v for k, v in filter.items()):
-                        continue
-
-                # Generate mock similarity score (higher for earlier results)
-                score = 0.95 - (i * 0.1)
+            # Return matches from stored vectors, visiting only the first top_k
+            if filter:
+                candidates = (
+                    (vector_id, vectors[vector_id])
+                    for vector_id in self._filter_ids(namespace, filter)
+                )
+            else:
+                candidates = vectors.items()
+            selected = list(islice(candidates, top_k))
 
+            # Mock similarity scores, higher for earlier results
+            scores = _mock_scores(0.95, 0.1, len(selected))
+            for (vector_id, vector_data), score in zip(selected, scores):
                 matches.append({
                     "id": vector_id,
                     "score": score,
@@ -128,21 +195,14 @@ class MockPineconeIndex:
 
         return {"matches": matches, "namespace": namespace}
 
-    def _get_default_matches(self, top_k: int) -> List[MockMatch]:
-        """Generate default mock matches."""
-        matches = []
-        for i in range(top_k):
-            matches.append(MockMatch(
-                id=f"mock-incident-{i:03d}",
-                score=0.90 - (i * 0.08),
-                metadata={
-                    "error_code": "PAYMENT_FAILED",
-                    "vendor": "stripe",
-                    "timestamp": "2026-01-19T10:00:00Z",
-                    "resolution": "retry_successful" if i % 2 == 0 else "escalated"
-                }
-            ))
-        return matches
+    def _default_matches(self, top_k: int) -> Iterator[Dict[str, Any]]:
+        """Generate default mock matches as result dicts."""
+        for i, score in enumerate(_mock_scores(0.90, 0.08, top_k)):
+            yield {
+                "id": f"mock-incident-{i:03d}",
+                "score": score,
+                "metadata": _DEFAULT_MATCH_METADATA[i % 2]
+            }
 
     def delete(
         self,
@@ -151,16 +211,21 @@ class MockPineconeIndex:
         namespace: str = ""
     ) -> Dict[str, Any]:
         """Mock delete operation."""
+        vectors = self._namespaces.get(namespace, {})
+
         if delete_all:
-            count = len(self._vectors)
-            self._vectors.clear()
+            count = len(vectors)
+            self._namespaces.pop(namespace, None)
+            for index_key in [k for k in self._filter_index if k[0] == namespace]:
+                del self._filter_index[index_key]
             return {"deleted_count": count}
 
         if ids:
             count = 0
             for vector_id in ids:
-                if vector_id in self._vectors:
-                    del self._vectors[vector_id]
+                vector_data = vectors.pop(vector_id, None)
+                if vector_data is not None:
+                    self._unindex_metadata(namespace, vector_id, vector_data["metadata"])
                     count += 1
             return {"deleted_count": count}
 
@@ -168,15 +233,15 @@ class MockPineconeIndex:
 
     def describe_index_stats(self) -> Dict[str, Any]:
         """Mock index stats."""
+        namespaces = {
+            namespace: {"vector_count": len(vectors)}
+            for namespace, vectors in self._namespaces.items()
+        } or {"": {"vector_count": 0}}
         return {
             "dimension": 1536,
             "index_fullness": 0.1,
-            "namespaces": {
-                "": {
-                    "vector_count": len(self._vectors)
-                }
-            },
-            "total_vector_count": len(self._vectors)
+            "namespaces": namespaces,
+            "total_vector_count": sum(ns["vector_count"] for ns in namespaces.values())
         }
 
 
@@ -23,16 +23,23 @@ class VendorErrorType(str, Enum):
 class MockStripeClient:
     """Mock Stripe API client."""
 
-    def __init__(self, api_key: str, error_mode: Optional[VendorErrorType] = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        error_mode: Optional[VendorErrorType] = None,
+        timeout_delay: float = 0.0
+    ) -> None:
         """
         Initialize mock Stripe client.
 
         Args:
             api_key: API key (not used in mock)
             error_mode: If set, client will simulate this error
+            timeout_delay: Seconds to wait before raising a simulated timeout
         """
         self.api_key = api_key
         self.error_mode = error_mode
+        self.timeout_delay = timeout_delay
 
     def create_payment_intent(
         self,
@@ -47,7 +54,8 @@ class MockStripeClient:
             Mock payment intent response
         """
         if self.error_mode == VendorErrorType.TIMEOUT:
-            time.sleep(10)  # Simulate timeout
+            if self.timeout_delay:
+                time.sleep(self.timeout_delay)
             raise TimeoutError("Request timed out")
 
         if self.error_mode == VendorErrorType.RATE_LIMIT:
@@ -79,11 +87,18 @@ class MockStripeClient:
 class MockPlaidClient:
     """Mock Plaid API client."""
 
-    def __init__(self, client_id: str, secret: str, error_mode: Optional[VendorErrorType] = None) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        secret: str,
+        error_mode: Optional[VendorErrorType] = None,
+        timeout_delay: float = 0.0
+    ) -> None:
         """Initialize mock Plaid client."""
         self.client_id = client_id
         self.secret = secret
         self.error_mode = error_mode
+        self.timeout_delay = timeout_delay
 
     def get_balance(self, access_token: str) -> Dict[str, Any]:
         """
@@ -93,7 +108,8 @@ class MockPlaidClient:
             Mock balance response
         """
         if self.error_mode == VendorErrorType.TIMEOUT:
-            time.sleep(10)
+            if self.timeout_delay:
+                time.sleep(self.timeout_delay)
             raise TimeoutError("Request timed out")
 
         if self.error_mode == VendorErrorType.AUTHENTICATION_FAILED:
@@ -131,11 +147,18 @@ class MockPlaidClient:
 class MockTwilioClient:
     """Mock Twilio API client."""
 
-    def __init__(self, account_sid: str, auth_token: str, error_mode: Optional[VendorErrorType] = None) -> None:
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        error_mode: Optional[VendorErrorType] = None,
+        timeout_delay: float = 0.0
+    ) -> None:
         """Initialize mock Twilio client."""
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.error_mode = error_mode
+        self.timeout_delay = timeout_delay
 
     def send_message(
         self,
@@ -150,7 +173,8 @@ class MockTwilioClient:
             Mock message response
         """
         if self.error_mode == VendorErrorType.TIMEOUT:
-            time.sleep(10)
+            if self.timeout_delay:
+                time.sleep(self.timeout_delay)
             raise TimeoutError("Request timed out")
 
         if self.error_mode == VendorErrorType.RATE_LIMIT:
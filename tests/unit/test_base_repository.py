@@ -0,0 +1,55 @@
+"""
+Unit tests for the generic base repository.
+
+Tests filter construction without a live database.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.awfdrs.db.repositories.tenants import TenantRepository
+
+
+@pytest.fixture
+def session():
+    """Provide a mock async session returning an empty result."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = result
+    return mock_session
+
+
+async def test_list_applies_known_column_filters(session):
+    """Test that known columns are turned into WHERE clauses."""
+    # ARRANGE
+    repo = TenantRepository(session)
+
+    # ACT
+    await repo.list(filters={"is_active": True})
+
+    # ASSERT
+    stmt = session.execute.call_args.args[0]
+    assert "tenants.is_active" in str(stmt)
+
+
+async def test_list_rejects_unknown_filter_columns(session):
+    """Test that unknown filter columns fail fast instead of being ignored."""
+    # ARRANGE
+    repo = TenantRepository(session)
+
+    # ACT / ASSERT
+    with pytest.raises(ValueError, match="is_actve"):
+        await repo.list(filters={"is_actve": True})
+
+    session.execute.assert_not_called()
+
+
+def test_column_map_is_shared_between_instances(session):
+    """Test that constructing a repository reuses the per-model column map."""
+    # ARRANGE / ACT
+    first = TenantRepository(session)
+    second = TenantRepository(AsyncMock())
+
+    # ASSERT
+    assert first._columns is second._columns
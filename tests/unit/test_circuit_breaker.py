@@ -0,0 +1,69 @@
+"""
+Unit tests for circuit breaker manager.
+
+Tests configuration loading and state transitions with a mocked session.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.awfdrs.core.enums import CircuitBreakerState
+from src.awfdrs.safety.circuit_breaker import CircuitBreakerManager
+
+
+def test_vendor_configs_are_parsed_once_per_directory():
+    """Test that managers for the same config directory share parsed YAML."""
+    # ACT
+    first = CircuitBreakerManager(AsyncMock())
+    second = CircuitBreakerManager(AsyncMock())
+
+    # ASSERT
+    assert first.vendor_configs is second.vendor_configs
+
+
+async def test_record_failure_is_a_single_repository_call():
+    """Test that a failure is recorded without loading the vendor first."""
+    # ARRANGE
+    manager = CircuitBreakerManager(AsyncMock())
+    manager.vendor_repo = AsyncMock()
+    manager.vendor_repo.record_failure.return_value = SimpleNamespace(
+        circuit_breaker_state=CircuitBreakerState.OPEN
+    )
+    vendor_id = uuid4()
+
+    # ACT
+    state = await manager.record_failure(vendor_id)
+
+    # ASSERT
+    assert state == CircuitBreakerState.OPEN
+    manager.vendor_repo.get.assert_not_awaited()
+    manager.vendor_repo.record_failure.assert_awaited_once()
+
+
+async def test_check_state_maps_missing_vendor_to_closed():
+    """Test that an unknown vendor is treated as CLOSED."""
+    # ARRANGE
+    manager = CircuitBreakerManager(AsyncMock())
+    manager.vendor_repo = AsyncMock()
+    manager.vendor_repo.check_open_timeout.return_value = None
+
+    # ACT
+    state = await manager.check_state(uuid4())
+
+    # ASSERT
+    assert state == CircuitBreakerState.CLOSED
+
+
+async def test_check_state_returns_half_open_after_timeout():
+    """Test that the state reported by the conditional UPDATE is returned."""
+    # ARRANGE
+    manager = CircuitBreakerManager(AsyncMock())
+    manager.vendor_repo = AsyncMock()
+    manager.vendor_repo.check_open_timeout.return_value = CircuitBreakerState.HALF_OPEN.value
+
+    # ACT
+    state = await manager.check_state(uuid4())
+
+    # ASSERT
+    assert state == CircuitBreakerState.HALF_OPEN
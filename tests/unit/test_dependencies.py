@@ -0,0 +1,32 @@
+"""
+Unit tests for FastAPI dependencies.
+"""
+
+from starlette.requests import Request
+
+from src.awfdrs.dependencies import get_correlation_id
+
+
+async def test_get_correlation_id_reads_request_state():
+    """Test that the correlation ID set on request.state is returned."""
+    # ARRANGE
+    request = Request({"type": "http"})
+    request.state.correlation_id = "abc-123"
+
+    # ACT
+    correlation_id = await get_correlation_id(request)
+
+    # ASSERT
+    assert correlation_id == "abc-123"
+
+
+async def test_get_correlation_id_defaults_to_unknown():
+    """Test the fallback when no middleware has set a correlation ID."""
+    # ARRANGE
+    request = Request({"type": "http"})
+
+    # ACT
+    correlation_id = await get_correlation_id(request)
+
+    # ASSERT
+    assert correlation_id == "unknown"
@@ -0,0 +1,51 @@
+"""
+Unit tests for the readiness probe.
+
+Tests that the database probe result is reused for concurrent and
+back-to-back polls.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.awfdrs.ingestion.api.v1 import health
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache(monkeypatch):
+    """Start each test with an empty probe cache."""
+    monkeypatch.setattr(health, "_cached_database_status", None)
+    monkeypatch.setattr(health, "_cached_at", 0.0)
+
+
+async def test_readiness_probe_result_is_reused():
+    """Test that concurrent readiness polls share one SELECT 1."""
+    # ARRANGE
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+
+    # ACT
+    responses = await asyncio.gather(*(health.readiness_check(session) for _ in range(5)))
+
+    # ASSERT
+    assert all(response.status == "ready" for response in responses)
+    session.execute.assert_awaited_once()
+
+
+async def test_readiness_probe_refreshes_after_expiry(monkeypatch):
+    """Test that a stale result triggers a new probe."""
+    # ARRANGE
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    await health.readiness_check(session)
+    monkeypatch.setattr(health, "_cached_at", 0.0)
+    session.execute.side_effect = RuntimeError("connection refused")
+
+    # ACT
+    response = await health.readiness_check(session)
+
+    # ASSERT
+    assert response.status == "not_ready"
+    assert session.execute.await_count == 2
@@ -0,0 +1,31 @@
+"""
+Unit tests for incident repository.
+
+Tests query construction without a live database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.awfdrs.db.repositories.incidents import IncidentRepository
+
+
+async def test_active_signature_lookup_inlines_status_predicate():
+    """Test that the DETECTED filter is rendered as a literal matching the partial index."""
+    # ARRANGE
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    session = AsyncMock()
+    session.execute.return_value = result
+    repo = IncidentRepository(session)
+
+    # ACT
+    await repo.get_active_by_signature(uuid4(), "sig-1")
+
+    # ASSERT
+    stmt = session.execute.call_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+    assert "incidents.status = 'detected'" in str(compiled)
+    assert "detected" not in compiled.params.values()
@@ -0,0 +1,80 @@
+"""
+Unit tests for buffered event ingestion.
+
+Tests that concurrent submissions are coalesced into one batch without a live database.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from src.awfdrs.core.exceptions import ConflictError
+from src.awfdrs.ingestion.schemas import WorkflowEventV1
+from src.awfdrs.ingestion.service import IngestionService, _BufferedFlusher
+
+
+def _make_event(idempotency_key: str) -> WorkflowEventV1:
+    return WorkflowEventV1(
+        tenant_id=uuid4(),
+        workflow_id=uuid4(),
+        event_type="payment.failed",
+        payload={"amount": 100},
+        idempotency_key=idempotency_key,
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+
+async def test_concurrent_submissions_share_one_flush():
+    """Test that events submitted together are stored by a single batch call."""
+    # ARRANGE
+    session = AsyncMock()
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = session
+    event_ids = [uuid4(), uuid4()]
+    conflict = ConflictError("duplicate")
+    ingest_batch = AsyncMock(return_value=[event_ids[0], conflict, event_ids[1]])
+    flusher = _BufferedFlusher()
+
+    with patch("src.awfdrs.ingestion.service.AsyncSessionLocal", session_factory), \
+            patch.object(IngestionService, "_ingest_batch", ingest_batch):
+        flusher.start(batch_size=10, batch_ms=50)
+
+        # ACT
+        results = await asyncio.gather(
+            flusher.submit(_make_event("key-1"), "corr-1"),
+            flusher.submit(_make_event("key-2"), "corr-2"),
+            flusher.submit(_make_event("key-3"), "corr-3"),
+            return_exceptions=True,
+        )
+        await flusher.stop()
+
+    # ASSERT
+    assert ingest_batch.await_count == 1
+    assert ingest_batch.await_args.args[1] == ["corr-1", "corr-2", "corr-3"]
+    assert results == [event_ids[0], conflict, event_ids[1]]
+    session.commit.assert_awaited_once()
+    assert not flusher.running
+
+
+async def test_stop_flushes_pending_events():
+    """Test that stopping the flusher still writes events already queued."""
+    # ARRANGE
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = AsyncMock()
+    event_id = uuid4()
+    ingest_batch = AsyncMock(return_value=[event_id])
+    flusher = _BufferedFlusher()
+
+    with patch("src.awfdrs.ingestion.service.AsyncSessionLocal", session_factory), \
+            patch.object(IngestionService, "_ingest_batch", ingest_batch):
+        flusher.start(batch_size=10, batch_ms=10_000)
+        pending = asyncio.create_task(flusher.submit(_make_event("key-1"), "corr-1"))
+        await asyncio.sleep(0)
+
+        # ACT
+        await flusher.stop()
+
+    # ASSERT
+    assert await pending == event_id
+    ingest_batch.assert_awaited_once()
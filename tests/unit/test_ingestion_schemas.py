@@ -0,0 +1,75 @@
+"""
+Unit tests for ingestion schemas.
+
+Tests payload validation performed while parsing WorkflowEventV1.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+from uuid import uuid4
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from src.awfdrs.ingestion.schemas import MAX_PAYLOAD_BYTES, WorkflowEventListAdapter, WorkflowEventV1
+
+
+def _make_event(payload: Dict[str, Any]) -> WorkflowEventV1:
+    return WorkflowEventV1(
+        tenant_id=uuid4(),
+        workflow_id=uuid4(),
+        event_type="payment.failed",
+        payload=payload,
+        idempotency_key="order-123",
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+
+def test_small_payload_is_not_serialized():
+    """Test that a small flat payload is accepted without being serialized."""
+    # ACT
+    event = _make_event({"amount": 100, "currency": "USD"})
+
+    # ASSERT
+    assert event.payload_json is None
+
+
+def test_nested_payload_keeps_serialized_form():
+    """Test that a nested payload is serialized once and kept for storage."""
+    # ARRANGE
+    payload = {"amount": 100, "customer": {"id": "cus_123", "tags": ["vip"]}}
+
+    # ACT
+    event = _make_event(payload)
+
+    # ASSERT
+    assert orjson.loads(event.payload_json) == payload
+
+
+def test_oversized_payload_is_rejected():
+    """Test that payloads over the size limit are rejected."""
+    # ACT & ASSERT
+    with pytest.raises(ValidationError, match="Payload size exceeds"):
+        _make_event({"blob": ["x" * MAX_PAYLOAD_BYTES]})
+
+
+def test_empty_payload_is_rejected():
+    """Test that an empty payload is rejected."""
+    # ACT & ASSERT
+    with pytest.raises(ValidationError, match="Payload cannot be empty"):
+        _make_event({})
+
+
+def test_event_list_adapter_parses_json_array():
+    """Test that a JSON array of events is parsed into WorkflowEventV1 models."""
+    # ARRANGE
+    events = [_make_event({"customer": {"id": f"cus_{i}"}}) for i in range(3)]
+    body = orjson.dumps([event.model_dump(mode="json") for event in events])
+
+    # ACT
+    parsed = WorkflowEventListAdapter.validate_json(body)
+
+    # ASSERT
+    assert [event.tenant_id for event in parsed] == [event.tenant_id for event in events]
+    assert all(event.payload_json is not None for event in parsed)
@@ -0,0 +1,111 @@
+"""
+Unit tests for ingestion service validation.
+
+Tests the single-query preflight check and conflict handling with mocked session and cache.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.awfdrs.core.exceptions import (
+    ConflictError,
+    KillSwitchActiveError,
+    NotFoundError,
+    ValidationError,
+)
+from src.awfdrs.ingestion.schemas import WorkflowEventV1
+from src.awfdrs.ingestion.service import IngestionService
+
+
+def _make_event() -> WorkflowEventV1:
+    return WorkflowEventV1(
+        tenant_id=uuid4(),
+        workflow_id=uuid4(),
+        event_type="payment.failed",
+        payload={"amount": 100},
+        idempotency_key="order-123",
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+
+def _session_returning(**row) -> AsyncMock:
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(**row)
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+async def test_preflight_issues_a_single_query():
+    """Test that tenant and workflow checks share one SELECT."""
+    # ARRANGE
+    session = _session_returning(is_active=True, is_kill_switched=False)
+    service = IngestionService(session, "corr-1")
+
+    # ACT
+    await service._preflight(_make_event())
+
+    # ASSERT
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.parametrize(
+    "row,expected_error",
+    [
+        ({"is_active": None, "is_kill_switched": False}, NotFoundError),
+        ({"is_active": False, "is_kill_switched": False}, ValidationError),
+        ({"is_active": True, "is_kill_switched": None}, NotFoundError),
+        ({"is_active": True, "is_kill_switched": True}, KillSwitchActiveError),
+    ],
+)
+async def test_preflight_raises_for_invalid_row(row, expected_error):
+    """Test that each failing column of the preflight row maps to its error."""
+    # ARRANGE
+    service = IngestionService(_session_returning(**row), "corr-1")
+
+    # ACT & ASSERT
+    with pytest.raises(expected_error):
+        await service._preflight(_make_event())
+
+
+async def test_preflight_skips_database_on_cache_hit():
+    """Test that cached tenant and workflow status needs no query."""
+    # ARRANGE
+    session = AsyncMock()
+    cache = AsyncMock()
+    cache.get_event_states.return_value = (True, False)
+    service = IngestionService(session, "corr-1", cache)
+
+    # ACT
+    await service._preflight(_make_event())
+
+    # ASSERT
+    session.execute.assert_not_awaited()
+
+
+async def test_create_event_conflict_raises_with_existing_id():
+    """Test that an insert skipped by ON CONFLICT reports the existing event."""
+    # ARRANGE
+    existing = SimpleNamespace(id=uuid4())
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = existing
+    session = AsyncMock()
+    session.scalar.return_value = None
+    session.execute.return_value = result
+    service = IngestionService(session, "corr-1")
+
+    # ACT & ASSERT
+    with pytest.raises(ConflictError) as exc_info:
+        await service.event_repo.create_event(
+            tenant_id=uuid4(),
+            workflow_id=uuid4(),
+            event_type="payment.failed",
+            payload={"amount": 100},
+            idempotency_key="order-123",
+            occurred_at=datetime.now(timezone.utc),
+        )
+    assert exc_info.value.details["event_id"] == str(existing.id)
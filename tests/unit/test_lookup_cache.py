@@ -0,0 +1,44 @@
+"""
+Unit tests for the ingestion lookup cache.
+
+Tests Redis key handling and fail-open behaviour with a mocked client.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.awfdrs.core.cache import LookupCache
+
+
+async def test_get_tenant_states_returns_only_hits():
+    """Test that cached flags are decoded and misses are omitted."""
+    # ARRANGE
+    active, inactive, missing = uuid4(), uuid4(), uuid4()
+    redis_client = AsyncMock()
+    redis_client.mget.return_value = ["1", "0", None]
+    cache = LookupCache(redis_client)
+
+    # ACT
+    states = await cache.get_tenant_states([active, inactive, missing])
+
+    # ASSERT
+    redis_client.mget.assert_awaited_once_with(
+        [f"tenant:{active}", f"tenant:{inactive}", f"tenant:{missing}"]
+    )
+    assert states == {active: True, inactive: False}
+
+
+async def test_cache_fails_open_when_redis_unavailable():
+    """Test that Redis errors turn into cache misses."""
+    # ARRANGE
+    redis_client = AsyncMock()
+    redis_client.mget.side_effect = ConnectionError("redis down")
+    cache = LookupCache(redis_client)
+
+    # ACT
+    states = await cache.get_workflow_states([uuid4()])
+    event_states = await cache.get_event_states(uuid4(), uuid4())
+
+    # ASSERT
+    assert states == {}
+    assert event_states == (None, None)
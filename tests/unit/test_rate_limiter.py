@@ -0,0 +1,121 @@
+"""
+Unit tests for the Redis rate limiter.
+
+Tests the single-call token bucket path with a mocked Redis client, and the
+bucket script itself against an in-process Redis.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.awfdrs.safety.rate_limiter import RateLimiter, _bucket_key
+
+
+@pytest.fixture
+def limiter(mock_redis):
+    """Provide a rate limiter on the mocked Redis client."""
+    return RateLimiter(mock_redis)
+
+
+@pytest.fixture
+def small_bucket_limiter(fake_redis, monkeypatch):
+    """Provide a rate limiter on the in-process Redis with a 2 request/minute vendor."""
+    limiter = RateLimiter(fake_redis)
+    monkeypatch.setitem(
+        limiter.vendor_configs, "tiny", {"rate_limit": {"requests_per_minute": 2}}
+    )
+    return limiter
+
+
+async def test_consume_token_is_one_script_call(limiter, mock_redis):
+    """Test that an allowed request is checked and counted in one call."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [1, 99, -1]
+    tenant_id = uuid4()
+
+    # ACT
+    result = await limiter.acquire("stripe", tenant_id)
+
+    # ASSERT
+    assert result.allowed is True
+    assert result.remaining == 99
+    mock_redis.evalsha.assert_awaited_once()
+    assert mock_redis.evalsha.call_args.args[2] == f"ratelimit:bucket:stripe:{tenant_id}"
+    mock_redis.get.assert_not_called()
+
+
+async def test_consume_token_rejects_with_retry_after(limiter, mock_redis):
+    """Test that a rejected request reports the script's wait until the next token."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [0, 0, 42]
+
+    # ACT
+    result = await limiter.acquire("stripe", uuid4())
+    consumed = await limiter.consume_token("stripe", uuid4())
+
+    # ASSERT
+    assert result.allowed is False
+    assert result.retry_after == 42
+    assert consumed is False
+
+
+async def test_consume_token_fails_open(limiter, mock_redis):
+    """Test that a Redis error allows the request."""
+    # ARRANGE
+    mock_redis.evalsha.side_effect = ConnectionError("redis down")
+
+    # ACT
+    consumed = await limiter.consume_token("stripe", uuid4())
+
+    # ASSERT
+    assert consumed is True
+
+
+async def test_check_rate_limit_does_not_consume(limiter, mock_redis):
+    """Test that checking the limit runs the bucket script in peek mode."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [1, 4, -1]
+
+    # ACT
+    result = await limiter.check_rate_limit("stripe", uuid4())
+
+    # ASSERT
+    assert result.allowed is True
+    assert mock_redis.evalsha.call_args.args[3:] == (100, 100 / 60, 0)
+
+
+async def test_bucket_script_drains_and_reports_ceiling_retry_after(small_bucket_limiter):
+    """Test that an empty bucket rejects with the whole seconds until one token refills."""
+    # ARRANGE
+    tenant_id = uuid4()
+
+    # ACT
+    peeked = await small_bucket_limiter.check_rate_limit("tiny", tenant_id)
+    results = [await small_bucket_limiter.acquire("tiny", tenant_id) for _ in range(3)]
+
+    # ASSERT
+    assert peeked.remaining == 1
+    assert [(r.allowed, r.remaining) for r in results] == [(True, 1), (True, 0), (False, 0)]
+    # 2 tokens/minute refill one token every 30s; a few ms have already refilled
+    assert results[2].retry_after == 30
+
+
+async def test_bucket_script_refills_with_elapsed_time(small_bucket_limiter, fake_redis):
+    """Test that tokens refill at the per-minute rate since the last request."""
+    # ARRANGE
+    tenant_id = uuid4()
+    for _ in range(2):
+        await small_bucket_limiter.acquire("tiny", tenant_id)
+    key = _bucket_key("tiny", tenant_id)
+    last_refill = int(await fake_redis.hget(key, "ts"))
+
+    # ACT: move the last refill 30s into the past, worth exactly one token
+    await fake_redis.hset(key, "ts", last_refill - 30_000)
+    refilled = await small_bucket_limiter.acquire("tiny", tenant_id)
+    drained = await small_bucket_limiter.acquire("tiny", tenant_id)
+
+    # ASSERT
+    assert refilled.allowed is True
+    assert drained.allowed is False
+    assert 0 < await fake_redis.pttl(key) <= 60_000
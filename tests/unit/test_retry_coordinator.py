@@ -0,0 +1,70 @@
+"""
+Unit tests for retry coordination.
+
+Tests that retries denied by a safety check use no retry budget, against an in-process Redis.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.awfdrs.actions.retry_coordinator import RetryCoordinator
+from src.awfdrs.core.enums import CircuitBreakerState
+from src.awfdrs.safety.limits import SafetyLimitsEnforcer
+
+
+@pytest.fixture
+def coordinator(fake_redis):
+    """Provide a coordinator on the in-process Redis with a closed circuit breaker."""
+    coordinator = RetryCoordinator(AsyncMock(), "corr-1")
+    coordinator.safety_limits = SafetyLimitsEnforcer(fake_redis)
+    coordinator.circuit_breaker = AsyncMock()
+    coordinator.circuit_breaker.check_state.return_value = CircuitBreakerState.CLOSED
+    return coordinator
+
+
+async def test_vendor_denial_leaves_workflow_counter_unchanged(coordinator, fake_redis):
+    """Test that a retry denied by the vendor limit is not counted for the workflow."""
+    # ARRANGE
+    workflow_id = uuid4()
+    vendor_id = uuid4()
+    await fake_redis.set(
+        f"safety:vendor_retries:{vendor_id}",
+        coordinator.safety_limits._max_vendor_retries
+    )
+
+    # ACT
+    allowed = await coordinator.check_retry_limits(workflow_id, vendor_id)
+
+    # ASSERT
+    assert allowed is False
+    assert await fake_redis.get(f"safety:workflow_retries:{workflow_id}") is None
+
+
+async def test_open_circuit_uses_no_retry_budget(coordinator, fake_redis):
+    """Test that an open circuit denies the retry before any counter is touched."""
+    # ARRANGE
+    coordinator.circuit_breaker.check_state.return_value = CircuitBreakerState.OPEN
+
+    # ACT
+    allowed = await coordinator.check_retry_limits(uuid4(), uuid4())
+
+    # ASSERT
+    assert allowed is False
+    assert await fake_redis.dbsize() == 0
+
+
+async def test_allowed_retry_counts_against_both_limits(coordinator, fake_redis):
+    """Test that a permitted retry increments the workflow and vendor counters."""
+    # ARRANGE
+    workflow_id = uuid4()
+    vendor_id = uuid4()
+
+    # ACT
+    allowed = await coordinator.check_retry_limits(workflow_id, vendor_id)
+
+    # ASSERT
+    assert allowed is True
+    assert await fake_redis.get(f"safety:workflow_retries:{workflow_id}") == "1"
+    assert await fake_redis.get(f"safety:vendor_retries:{vendor_id}") == "1"
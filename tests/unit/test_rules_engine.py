@@ -6,24 +6,15 @@ Tests error severity evaluation and retry policy determination.
 
 import pytest
 from src.awfdrs.safety.rules_engine import RulesEngine
+from src.awfdrs.safety.schemas import ErrorContext
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rules_engine():
-    """Provide RulesEngine instance for tests."""
+    """Provide one RulesEngine instance shared by all tests; it holds no per-test state."""
     return RulesEngine()
 
 
-def test_get_error_severity_for_payment_timeout(rules_engine):
-    """Test severity lookup for payment timeout error."""
-    # ACT
-    severity = rules_engine.get_error_severity("payment_timeout")
-
-    # ASSERT
-    assert severity in ["low", "medium", "high", "critical"]
-    assert severity == "high"  # Based on config/rules/error_codes.yaml
-
-
 def test_get_error_severity_for_unknown_code_returns_default(rules_engine):
     """Test that unknown error codes return default medium severity."""
     # ACT
@@ -56,24 +47,6 @@ def test_get_retry_policy_for_non_retryable_error(rules_engine):
     assert policy["max_retries"] == 0
 
 
-def test_is_retryable_returns_true_for_transient_errors(rules_engine):
-    """Test that transient errors are marked as retryable."""
-    # ACT
-    result = rules_engine.is_retryable("payment_timeout")
-
-    # ASSERT
-    assert result is True
-
-
-def test_is_retryable_returns_false_for_permanent_errors(rules_engine):
-    """Test that permanent errors are not retryable."""
-    # ACT
-    result = rules_engine.is_retryable("invalid_card")
-
-    # ASSERT
-    assert result is False
-
-
 def test_get_retry_policy_includes_backoff_configuration(rules_engine):
     """Test that retry policy includes backoff parameters."""
     # ACT
@@ -87,7 +60,7 @@ def test_get_retry_policy_includes_backoff_configuration(rules_engine):
 
 
 @pytest.mark.parametrize("error_code,expected_severity", [
-    ("payment_timeout", "high"),
+    ("payment_timeout", "high"),  # Based on config/rules/error_codes.yaml
     ("network_error", "medium"),
     ("validation_error", "low"),
 ])
@@ -125,3 +98,73 @@ def test_error_code_lookup_is_case_insensitive(rules_engine):
 
     # ASSERT
     assert severity_lower == severity_upper == severity_mixed
+
+
+@pytest.fixture
+def configured_rules_engine(tmp_path):
+    """Provide a RulesEngine loaded from a minimal config in the shape it parses."""
+    (tmp_path / "error_codes.yaml").write_text(
+        "error_codes:\n"
+        "  gateway_timeout:\n"
+        "    severity: high\n"
+        "    retry_policy: transient\n"
+    )
+    (tmp_path / "retry_policies.yaml").write_text(
+        "retry_policies:\n"
+        "  transient:\n"
+        "    retryable: true\n"
+        "    max_retries: 3\n"
+        "    initial_delay_seconds: 2.0\n"
+        "    max_delay_seconds: 10.0\n"
+        "    backoff_multiplier: 2.0\n"
+    )
+    return RulesEngine(config_dir=str(tmp_path))
+
+
+def test_compiled_rule_resolves_policy(configured_rules_engine):
+    """Test that an error code's retry policy is resolved once at load time."""
+    # ACT
+    evaluation = configured_rules_engine.evaluate_error(
+        "gateway_timeout", ErrorContext(error_code="gateway_timeout", retry_count=1)
+    )
+    exhausted = configured_rules_engine.should_retry("gateway_timeout", 3)
+
+    # ASSERT
+    assert evaluation.should_retry is True
+    assert evaluation.severity == "high"
+    assert evaluation.rule_triggered == "transient"
+    assert exhausted is False
+
+
+def test_calculate_backoff_uses_capped_exponential_delays(configured_rules_engine):
+    """Test that base delays grow exponentially up to the policy maximum."""
+    # ACT
+    delays = [
+        configured_rules_engine.calculate_backoff("gateway_timeout", attempt).base_delay
+        for attempt in range(5)
+    ]
+
+    # ASSERT
+    assert delays == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+def test_configuration_is_parsed_once_per_directory(configured_rules_engine):
+    """Test that engines for the same config directory share the parsed YAML."""
+    # ACT
+    second = RulesEngine(config_dir=str(configured_rules_engine.config_dir))
+
+    # ASSERT
+    assert second.error_codes is configured_rules_engine.error_codes
+    assert second.retry_policies is configured_rules_engine.retry_policies
+
+
+def test_calculate_backoff_jitter_stays_within_twenty_percent(configured_rules_engine):
+    """Test that pooled jitter keeps delays within ±20% of the base delay."""
+    # ACT
+    calculations = [
+        configured_rules_engine.calculate_backoff("gateway_timeout", 1) for _ in range(500)
+    ]
+
+    # ASSERT
+    assert all(abs(c.jitter) <= 0.2 * c.base_delay for c in calculations)
+    assert len({c.jitter for c in calculations}) > 1
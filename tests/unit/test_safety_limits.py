@@ -0,0 +1,228 @@
+"""
+Unit tests for safety limits enforcement.
+
+Tests the atomic check-and-increment path with a mocked Redis client, and
+the counter scripts themselves against an in-process Redis.
+"""
+
+import hashlib
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.awfdrs.config import settings
+from src.awfdrs.safety.limits import (
+    CHECK_AND_INCREMENT_ALL_SCRIPT,
+    CHECK_AND_INCREMENT_SCRIPT,
+    INCREMENT_SCRIPT,
+    TENANT_QUOTAS,
+    SafetyLimitsEnforcer
+)
+
+
+@pytest.fixture
+def enforcer(mock_redis):
+    """Provide an enforcer on the mocked Redis client."""
+    return SafetyLimitsEnforcer(mock_redis)
+
+
+@pytest.fixture
+def fake_enforcer(fake_redis):
+    """Provide an enforcer on the in-process Redis with retry limits of 2."""
+    enforcer = SafetyLimitsEnforcer(fake_redis)
+    enforcer._max_workflow_retries = 2
+    enforcer._max_vendor_retries = 2
+    return enforcer
+
+
+def _sha(script: bytes) -> str:
+    return hashlib.sha1(script).hexdigest()
+
+
+async def test_check_and_increment_is_one_script_call(enforcer, mock_redis):
+    """Test that an allowed retry is checked and counted in one EVALSHA."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [1, 1]
+    workflow_id = uuid4()
+
+    # ACT
+    allowed = await enforcer.check_and_increment_workflow_retry(workflow_id)
+
+    # ASSERT
+    assert allowed is True
+    mock_redis.evalsha.assert_awaited_once_with(
+        _sha(CHECK_AND_INCREMENT_SCRIPT),
+        1,
+        f"safety:workflow_retries:{workflow_id}",
+        settings.safety.max_retries_per_workflow,
+        3600
+    )
+
+
+async def test_check_and_increment_reports_limit_reached(enforcer, mock_redis):
+    """Test that a rejected script result is returned as not allowed."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [0, settings.safety.max_retries_per_vendor]
+
+    # ACT
+    allowed = await enforcer.check_and_increment_vendor_retry(uuid4())
+
+    # ASSERT
+    assert allowed is False
+
+
+async def test_check_and_increment_fails_open(enforcer, mock_redis):
+    """Test that a Redis error allows the operation."""
+    # ARRANGE
+    mock_redis.evalsha.side_effect = ConnectionError("redis down")
+
+    # ACT
+    allowed = await enforcer.check_and_increment_tenant_quota(uuid4(), "events")
+
+    # ASSERT
+    assert allowed is True
+
+
+async def test_check_and_increment_retries_is_one_script_call(enforcer, mock_redis):
+    """Test that workflow and vendor retries are checked and counted in one EVALSHA."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = [1, 0]
+    workflow_id = uuid4()
+    vendor_id = uuid4()
+
+    # ACT
+    result = await enforcer.check_and_increment_retries(workflow_id, vendor_id)
+
+    # ASSERT
+    assert result == (True, False)
+    mock_redis.evalsha.assert_awaited_once_with(
+        _sha(CHECK_AND_INCREMENT_ALL_SCRIPT),
+        2,
+        f"safety:workflow_retries:{workflow_id}",
+        f"safety:vendor_retries:{vendor_id}",
+        settings.safety.max_retries_per_workflow,
+        3600,
+        settings.safety.max_retries_per_vendor,
+        3600
+    )
+
+
+async def test_increment_uses_single_script_call(enforcer, mock_redis):
+    """Test that incrementing issues one EVALSHA instead of INCR + EXPIRE."""
+    # ARRANGE
+    mock_redis.evalsha.return_value = 3
+    tenant_id = uuid4()
+
+    # ACT
+    count = await enforcer.increment_tenant_quota(tenant_id, "events")
+
+    # ASSERT
+    assert count == 3
+    mock_redis.pipeline.assert_not_called()
+    mock_redis.evalsha.assert_awaited_once_with(
+        _sha(INCREMENT_SCRIPT), 1, f"safety:tenant_quota:{tenant_id}:events", 86400
+    )
+
+
+def test_enforcers_share_process_redis_client(monkeypatch):
+    """Test that enforcers without an injected client share one client."""
+    # ARRANGE
+    shared = MagicMock()
+    monkeypatch.setattr("src.awfdrs.safety.limits.get_redis_client", lambda: shared)
+
+    # ACT
+    first = SafetyLimitsEnforcer()
+    second = SafetyLimitsEnforcer()
+
+    # ASSERT
+    assert first.redis_client is shared
+    assert second.redis_client is shared
+
+
+async def test_check_all_reads_every_counter_in_one_call(enforcer, mock_redis):
+    """Test that all three limits are checked with a single MGET."""
+    # ARRANGE
+    mock_redis.mget = AsyncMock(
+        return_value=[str(settings.safety.max_retries_per_workflow), None, "1"]
+    )
+
+    # ACT
+    result = await enforcer.check_all(uuid4(), uuid4(), uuid4(), "events")
+
+    # ASSERT
+    assert result == (False, True, True)
+    mock_redis.mget.assert_awaited_once()
+    mock_redis.get.assert_not_called()
+
+
+async def test_unlimited_quota_skips_redis(enforcer, mock_redis, monkeypatch):
+    """Test that a quota of None is allowed without a Redis round-trip."""
+    # ARRANGE
+    monkeypatch.setitem(TENANT_QUOTAS, "events", None)
+    mock_redis.evalsha.return_value = [1, 1]
+    mock_redis.get = AsyncMock()
+
+    # ACT
+    checked = await enforcer.check_tenant_quota(uuid4(), "events")
+    recorded = await enforcer.check_and_increment_tenant_quota(uuid4(), "events")
+
+    # ASSERT
+    assert checked is True
+    assert recorded is True
+    mock_redis.get.assert_not_awaited()
+    mock_redis.evalsha.assert_not_awaited()
+
+
+async def test_check_and_increment_script_stops_at_limit(fake_enforcer, fake_redis):
+    """Test that the script counts up to the limit and sets the window once."""
+    # ARRANGE
+    workflow_id = uuid4()
+    key = f"safety:workflow_retries:{workflow_id}"
+
+    # ACT
+    results = [
+        await fake_enforcer.check_and_increment_workflow_retry(workflow_id) for _ in range(3)
+    ]
+
+    # ASSERT
+    assert results == [True, True, False]
+    assert await fake_redis.get(key) == "2"
+    assert 0 < await fake_redis.ttl(key) <= 3600
+
+
+async def test_increment_script_starts_window_on_first_hit(fake_enforcer, fake_redis):
+    """Test that the increment script only sets the TTL when it creates the counter."""
+    # ARRANGE
+    tenant_id = uuid4()
+    key = f"safety:tenant_quota:{tenant_id}:events"
+    await fake_enforcer.increment_tenant_quota(tenant_id, "events")
+    await fake_redis.expire(key, 10)
+
+    # ACT
+    count = await fake_enforcer.increment_tenant_quota(tenant_id, "events")
+
+    # ASSERT
+    assert count == 2
+    assert 0 < await fake_redis.ttl(key) <= 10
+
+
+async def test_check_and_increment_all_script_is_all_or_nothing(fake_enforcer, fake_redis):
+    """Test that a retry denied by the vendor limit leaves the workflow counter unchanged."""
+    # ARRANGE
+    workflow_id = uuid4()
+    vendor_id = uuid4()
+    workflow_key = f"safety:workflow_retries:{workflow_id}"
+    vendor_key = f"safety:vendor_retries:{vendor_id}"
+    await fake_redis.set(vendor_key, 2)
+
+    # ACT
+    denied = await fake_enforcer.check_and_increment_retries(workflow_id, vendor_id)
+    await fake_redis.set(vendor_key, 1)
+    allowed = await fake_enforcer.check_and_increment_retries(workflow_id, vendor_id)
+
+    # ASSERT
+    assert denied == (True, False)
+    assert allowed == (True, True)
+    assert await fake_redis.get(workflow_key) == "1"
+    assert await fake_redis.get(vendor_key) == "2"
@@ -4,135 +4,89 @@ Unit tests for error signature generation.
 Tests the signature generation logic used for grouping similar incidents.
 """
 
+import pytest
+from types import MappingProxyType
 from uuid import UUID
 from datetime import datetime
 from src.awfdrs.analysis.signature import SignatureGenerator
 from src.awfdrs.db.models.events import Event
 
 
-def test_generate_signature_for_payment_timeout():
-    """Test signature generation for payment timeout error."""
+_EVENT_ID_1 = UUID("00000000-0000-0000-0000-000000000001")
+_EVENT_ID_2 = UUID("00000000-0000-0000-0000-000000000002")
+_TENANT_1 = UUID("10000000-0000-0000-0000-000000000001")
+_WF_1 = UUID("20000000-0000-0000-0000-000000000001")
+_WF_2 = UUID("30000000-0000-0000-0000-000000000001")
+_WF_1_STR = str(_WF_1)
+
+# Signatures do not depend on timestamps, so every event uses a fixed one
+_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+# Read-only payloads shared across tests; the generator only reads them
+_PL_TIMEOUT = MappingProxyType({"error_code": "timeout"})
+_PL_PAYMENT_TIMEOUT = MappingProxyType({"error_code": "payment_timeout"})
+_PL_TIMEOUT_ERROR = MappingProxyType({"error_code": "TIMEOUT_ERROR"})
+_PL_EMPTY = MappingProxyType({})
+
+# Field values shared by every test event; tests override only what they vary
+_EVENT_DEFAULTS = {
+    "id": _EVENT_ID_1,
+    "tenant_id": _TENANT_1,
+    "workflow_id": _WF_1,
+    "event_type": "payment.failed",
+    "payload": _PL_TIMEOUT,
+    "idempotency_key": "test-001",
+    "occurred_at": _TS,
+    "created_at": _TS,
+    "updated_at": _TS
+}
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """Provide one SignatureGenerator shared by every test in the session."""
+    return SignatureGenerator()
+
+
+@pytest.fixture
+def make_event():
+    """Provide a factory that builds an Event from the shared defaults plus overrides."""
+    def _make(**overrides) -> Event:
+        return Event(**{**_EVENT_DEFAULTS, **overrides})
+    return _make
+
+
+@pytest.mark.parametrize("event_type,payload,expected_signature", [
+    # Signature is event_type:error_code:workflow_id
+    ("payment.failed", _PL_PAYMENT_TIMEOUT,
+     f"payment.failed:payment_timeout:{_WF_1_STR}"),
+    # Error codes are normalized to lowercase
+    ("order.failed", _PL_TIMEOUT_ERROR, f"order.failed:timeout_error:{_WF_1_STR}"),
+    # A missing error_code falls back to "unknown"
+    ("generic.error", _PL_EMPTY, f"generic.error:unknown:{_WF_1_STR}"),
+    # The workflow ID is included for workflow-specific grouping
+    ("payment.failed", _PL_TIMEOUT, f"payment.failed:timeout:{_WF_1_STR}"),
+])
+def test_generate_signature(generator, make_event, event_type, payload, expected_signature):
+    """Test the signature generated for common error events."""
     # ARRANGE
-    generator = SignatureGenerator()
-    event = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=UUID("20000000-0000-0000-0000-000000000001"),
-        event_type="payment.failed",
-        payload={"error_code": "payment_timeout"},
-        idempotency_key="test-001",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-
-    # ACT
-    signature = generator.generate(event)
-
-    # ASSERT
-    assert signature == "payment.failed:payment_timeout:20000000-0000-0000-0000-000000000001"
-    assert isinstance(signature, str)
-
-
-def test_generate_signature_normalizes_error_code_to_lowercase():
-    """Test that error codes are normalized to lowercase."""
-    # ARRANGE
-    generator = SignatureGenerator()
-    event = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=UUID("20000000-0000-0000-0000-000000000001"),
-        event_type="order.failed",
-        payload={"error_code": "TIMEOUT_ERROR"},
-        idempotency_key="test-002",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-
-    # ACT
-    signature = generator.generate(event)
-
-    # ASSERT
-    assert "timeout_error" in signature
-    assert "TIMEOUT_ERROR" not in signature
-
-
-def test_generate_signature_handles_missing_error_code():
-    """Test signature generation when error_code is missing from payload."""
-    # ARRANGE
-    generator = SignatureGenerator()
-    event = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=UUID("20000000-0000-0000-0000-000000000001"),
-        event_type="generic.error",
-        payload={},  # No error_code
-        idempotency_key="test-003",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-
-    # ACT
-    signature = generator.generate(event)
-
-    # ASSERT
-    assert "unknown" in signature or "generic.error" in signature
-
-
-def test_generate_signature_includes_workflow_id():
-    """Test that signature includes workflow_id for workflow-specific grouping."""
-    # ARRANGE
-    generator = SignatureGenerator()
-    workflow_id = UUID("20000000-0000-0000-0000-000000000001")
-    event = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=workflow_id,
-        event_type="payment.failed",
-        payload={"error_code": "timeout"},
-        idempotency_key="test-004",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
+    event = make_event(event_type=event_type, payload=payload)
 
     # ACT
     signature = generator.generate(event)
 
     # ASSERT
-    assert str(workflow_id) in signature
+    assert signature == expected_signature
 
 
-def test_same_error_pattern_generates_same_signature():
+def test_same_error_pattern_generates_same_signature(generator, make_event):
     """Test that identical error patterns produce identical signatures."""
     # ARRANGE
-    generator = SignatureGenerator()
-    workflow_id = UUID("20000000-0000-0000-0000-000000000001")
-
-    event1 = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=workflow_id,
-        event_type="payment.failed",
-        payload={"error_code": "timeout"},
-        idempotency_key="test-005",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-
-    event2 = Event(
-        id=UUID("00000000-0000-0000-0000-000000000002"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=workflow_id,
-        event_type="payment.failed",
-        payload={"error_code": "timeout"},
-        idempotency_key="test-006",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+    event1 = make_event(workflow_id=_WF_1, idempotency_key="test-005")
+    event2 = make_event(
+        id=_EVENT_ID_2,
+        workflow_id=_WF_1,
+        idempotency_key="test-006"
     )
 
     # ACT
@@ -143,33 +97,14 @@ def test_same_error_pattern_generates_same_signature():
     assert signature1 == signature2
 
 
-def test_different_workflows_generate_different_signatures():
+def test_different_workflows_generate_different_signatures(generator, make_event):
     """Test that same error in different workflows produces different signatures."""
     # ARRANGE
-    generator = SignatureGenerator()
-
-    event1 = Event(
-        id=UUID("00000000-0000-0000-0000-000000000001"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=UUID("20000000-0000-0000-0000-000000000001"),
-        event_type="payment.failed",
-        payload={"error_code": "timeout"},
-        idempotency_key="test-007",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-
-    event2 = Event(
-        id=UUID("00000000-0000-0000-0000-000000000002"),
-        tenant_id=UUID("10000000-0000-0000-0000-000000000001"),
-        workflow_id=UUID("30000000-0000-0000-0000-000000000001"),  # Different workflow
-        event_type="payment.failed",
-        payload={"error_code": "timeout"},
-        idempotency_key="test-008",
-        occurred_at=datetime.utcnow(),
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+    event1 = make_event(idempotency_key="test-007")
+    event2 = make_event(
+        id=_EVENT_ID_2,
+        workflow_id=_WF_2,  # Different workflow
+        idempotency_key="test-008"
     )
 
     # ACT
@@ -0,0 +1,43 @@
+"""
+Unit tests for vendor repository.
+
+Tests repository construction and query building without a live database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.awfdrs.db.models.vendors import Vendor
+from src.awfdrs.db.repositories.vendors import VendorRepository
+
+
+def test_vendor_repository_binds_model_and_session():
+    """Test that the repository stores the Vendor model and the session."""
+    # ARRANGE
+    session = AsyncMock()
+
+    # ACT
+    repo = VendorRepository(session)
+
+    # ASSERT
+    assert repo.model is Vendor
+    assert repo.session is session
+
+
+async def test_get_by_name_queries_vendors_table():
+    """Test that get_by_name executes a SELECT against the vendors table."""
+    # ARRANGE
+    vendor = Vendor(name="stripe")
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = vendor
+    session = AsyncMock()
+    session.execute.return_value = result
+    repo = VendorRepository(session)
+
+    # ACT
+    found = await repo.get_by_name("stripe")
+
+    # ASSERT
+    assert found is vendor
+    stmt = session.execute.call_args.args[0]
+    assert "FROM vendors" in str(stmt)
+    assert "vendors.name" in str(stmt)